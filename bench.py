@@ -0,0 +1,170 @@
+# Compares the event loops on the auth, daily and reward commands, epic is swapped out for a small local server that
+# answers like it would so the numbers only depend on the bot (and how long the stand-in is told to wait)
+# usage: python bench.py [--requests 500] [--concurrency 50] [--latency 20] [--loops asyncio uvloop]
+import argparse
+import asyncio
+import math
+import time
+import types
+import uuid
+from collections import deque
+
+import aiohttp
+from aiohttp import web
+
+import stwconfig
+import stwutil as stw
+from ext.auth import Auth
+from ext.daily import Daily
+from ext.reward import Reward
+
+
+# just enough of epic's token, profile and kill endpoints for the commands to go through
+class EpicStandIn:
+
+    def __init__(self, latency):
+        self.latency = latency
+        self.runner = None
+        self.url = None
+
+    async def start(self):
+        app = web.Application()
+        app.router.add_post("/token", self.token)
+        app.router.add_post("/profile/{account_id}/client/{operation}", self.profile)
+        app.router.add_delete("/kill/{token}", self.kill)
+        self.runner = web.AppRunner(app)
+        await self.runner.setup()
+        await web.TCPSite(self.runner, "127.0.0.1", 0).start()
+        self.url = f"http://127.0.0.1:{self.runner.addresses[0][1]}"
+
+    async def close(self):
+        await self.runner.cleanup()
+
+    async def token(self, request):
+        await asyncio.sleep(self.latency)
+        return web.json_response({"access_token": uuid.uuid4().hex, "account_id": uuid.uuid4().hex,
+                                  "displayName": "bench"})
+
+    async def profile(self, request):
+        await asyncio.sleep(self.latency)
+        if request.match_info["operation"] == "ClaimLoginReward":
+            return web.json_response({"notifications": [{"type": "daily_rewards", "daysLoggedIn": 101,
+                                                         "items": [{"itemType": "AccountResource:heroxp",
+                                                                    "quantity": 300}]}]})
+        return web.json_response({"profileChanges": [{"profile": {
+            "stats": {"attributes": {"daily_rewards": {"totalDaysLoggedIn": 100}}},
+            "items": {"mtx": {"templateId": "Token:receivemtxcurrency", "quantity": 1}}}}]})
+
+    async def kill(self, request):
+        return web.Response(status=204)
+
+
+# commands only ever send and edit the reply, every command gets its own channel so discord's edit limit stays out of it
+class BenchMessage:
+    def __init__(self, message_id):
+        self.id = message_id
+        self.channel = types.SimpleNamespace(id=message_id)
+
+    async def edit(self, **kwargs):
+        return self
+
+
+class BenchContext:
+    def __init__(self, user_id, message_id):
+        self.author = types.SimpleNamespace(id=user_id, name="bench",
+                                            display_avatar=types.SimpleNamespace(url="https://example.com/a.png"))
+        self.message_id = message_id
+
+    async def send(self, **kwargs):
+        return BenchMessage(self.message_id)
+
+
+def bench_client(config, url):
+    client = types.SimpleNamespace()
+    endpoints = dict(config["endpoints"], token=f"{url}/token", kill_token=f"{url}/kill/{{}}",
+                     profile=f"{url}/profile/{{}}/client/{{}}?profileId={{}}")
+    client.config = stwconfig.CompiledConfig(dict(config, endpoints=endpoints), "bench")
+    client.colours = client.config.colours
+    client.items = stwconfig.load_items("items.py")
+    client.rewards = stwconfig.RewardTable(client.config, client.items)
+    client.user = types.SimpleNamespace(mention="<@1>", name="STW Daily")
+    client.temp_auth = {}
+    client.linked_auth = {}
+    client.session_timers = {}
+    client.shared_cache = stw.SharedCache()
+    client.cluster = None
+    client.http_interactions = False
+    client.ack_times = deque(maxlen=config["ack_sample_size"])
+    return client
+
+
+async def run_path(name, command, requests, concurrency):
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies = []
+
+    async def timed(number):
+        async with semaphore:
+            start = time.perf_counter()
+            await command(number)
+            latencies.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(timed(number) for number in range(requests)))
+    elapsed = time.perf_counter() - start
+
+    latencies.sort()
+    p99 = latencies[math.ceil(len(latencies) * 0.99) - 1]
+    return name, requests / elapsed, p99 * 1000
+
+
+async def run_benchmarks(config, args):
+    epic = EpicStandIn(args.latency / 1000)
+    await epic.start()
+    client = bench_client(config, epic.url)
+    client.stw_session = aiohttp.ClientSession(connector=aiohttp.TCPConnector(limit=0))
+    auth, daily, reward = Auth(client), Daily(client), Reward(client)
+
+    # every auth is a new user, daily and reward then run for the users auth signed in
+    async def auth_path(number):
+        await auth.auth_command(BenchContext(number, number), uuid.uuid4().hex)
+
+    async def daily_path(number):
+        await daily.daily_command(BenchContext(number, number), False, "", True)
+
+    async def reward_path(number):
+        await reward.reward_command(BenchContext(number, number), "hi readers of the bot")
+
+    try:
+        return [await run_path("auth", auth_path, args.requests, args.concurrency),
+                await run_path("daily", daily_path, args.requests, args.concurrency),
+                await run_path("reward", reward_path, args.requests, args.concurrency)]
+    finally:
+        await client.stw_session.close()
+        await epic.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare event loops on the auth, daily and reward commands")
+    parser.add_argument("--requests", type=int, default=500, help="commands run per path")
+    parser.add_argument("--concurrency", type=int, default=50, help="commands running at once")
+    parser.add_argument("--latency", type=float, default=20, help="ms the epic stand-in waits before answering")
+    parser.add_argument("--loops", nargs="+", default=["asyncio", "uvloop"], choices=["asyncio", "uvloop"])
+    args = parser.parse_args()
+
+    # the parsed toml, the endpoints get pointed at the stand-in before it's compiled
+    with open("config.toml", "rb") as config_file:
+        config = stwconfig.parse(config_file.read())
+
+    print(f"{'loop':<8} {'path':<8} {'commands/s':>12} {'p99 ms':>10}")
+    for loop in args.loops:
+        if stw.install_event_loop_policy(loop) != loop:
+            print(f"{loop:<8} not installed, skipped")
+            continue
+
+        for name, throughput, p99 in asyncio.run(run_benchmarks(config, args)):
+            print(f"{loop:<8} {name:<8} {throughput:>12.1f} {p99:>10.1f}")
+        asyncio.set_event_loop_policy(None)
+
+
+if __name__ == "__main__":
+    main()
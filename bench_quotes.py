@@ -0,0 +1,101 @@
+# Checks stw.escape_quotes against the regex version it replaced, then times both on the inputs that made the old one
+# slow (lots of quotes next to whitespace), the old one is kept here word for word as the reference
+# usage: python bench_quotes.py [--strings 200000] [--seed 0] [--length 4000]
+import argparse
+import random
+import re
+import time
+
+import stwutil as stw
+
+
+# process_quotes_in_message before the tokeniser, on a string instead of a message
+def old_escape_quotes(content):
+    # do not question the ways of the regex
+    re_iter = re.finditer(r'((?:(?:^|\s)\")|(?:\"(?:\s|$)))', content)
+
+    indices = [m.start(0) for m in re_iter]
+    content = list(content)
+
+    if len(indices) == 1:
+        indices = []
+
+    else:
+
+        rem_values = []
+
+        # true represents an ending ", False represents a starting "
+        temp_indices = [True if content[index] == '"' else False for index in indices]
+
+        for index, value in enumerate(temp_indices[:-1]):
+
+            if not value:
+                indices[index] += 1
+                if not temp_indices[index + 1]:
+                    rem_values.append(index + 1)
+
+            elif temp_indices[index + 1] and value:
+                rem_values.append(index)
+
+        for remove_index in rem_values:
+            indices[remove_index] = 0
+
+    # fear my list comprehension
+    escaped_content = [r'\\"' if char == '"' and index not in indices else char for index, char in enumerate(content)]
+
+    return "".join(escaped_content)
+
+
+# mostly quotes and whitespace (unicode whitespace too, \s matches it) so the edge cases come up all the time
+def random_message(rng):
+    alphabet = ['"', '"', '"', " ", " ", "\n", "\t", "　", "\xa0", "a", "b", "'", "\\"]
+    return "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 24)))
+
+
+def check(strings, seed):
+    rng = random.Random(seed)
+    for _ in range(strings):
+        content = random_message(rng)
+        expected, got = old_escape_quotes(content), stw.escape_quotes(content)
+        if expected != got:
+            print(f"differs on {content!r}:\n  old {expected!r}\n  new {got!r}")
+            return False
+
+    print(f"{strings} random strings, no differences")
+    return True
+
+
+def timed(function, content, repeats=5):
+    best = None
+    for _ in range(repeats):
+        start = time.perf_counter()
+        function(content)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check and time the quote escaping on adversarial inputs")
+    parser.add_argument("--strings", type=int, default=200000, help="random strings compared with the old version")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--length", type=int, default=4000, help="characters in each timed input")
+    args = parser.parse_args()
+
+    if not check(args.strings, args.seed):
+        raise SystemExit(1)
+
+    inputs = {
+        "' \"' repeated": ' "' * (args.length // 2),
+        "'\"a\" ' repeated": '"a" ' * (args.length // 4),
+        "only quotes": '"' * args.length,
+        "text, two quotes": '"' + "a" * (args.length - 2) + '"',
+    }
+
+    print(f"{'input':<20} {'old ms':>10} {'new ms':>10}")
+    for name, content in inputs.items():
+        print(f"{name:<20} {timed(old_escape_quotes, content):>10.2f} {timed(stw.escape_quotes, content):>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,208 @@
+print("Starting STW Daily clusters")
+
+import asyncio
+import hmac
+import json
+import os
+import secrets
+import sys
+import time
+
+import aiohttp
+
+import stwconfig
+import stwutil as stw
+
+
+# one "daily core.py" process running its own range of shards, the launcher talks to it over a local socket
+class Cluster:
+
+    def __init__(self, launcher, cluster_id, shard_ids):
+        self.launcher = launcher
+        self.cluster_id = cluster_id
+        self.shard_ids = shard_ids
+        self.process = None
+        self.writer = None
+        self.guilds = 0
+        self.ready = asyncio.Event()
+
+    async def start(self):
+        self.ready.clear()
+        env = dict(os.environ,
+                   STW_DAILY_CLUSTER=str(self.cluster_id),
+                   STW_DAILY_SHARD_IDS=",".join(str(shard_id) for shard_id in self.shard_ids),
+                   STW_DAILY_SHARD_COUNT=str(self.launcher.shard_count),
+                   STW_DAILY_IPC_PORT=str(self.launcher.port),
+                   STW_DAILY_IPC_SECRET=self.launcher.secret)
+        self.process = await asyncio.create_subprocess_exec(sys.executable, "daily core.py", env=env)
+        print(f"Cluster {self.cluster_id} started with shards {self.shard_ids[0]}-{self.shard_ids[-1]}")
+
+    # discord only lets so many shards identify at once, so the next cluster waits until this one is ready
+    async def wait_ready(self):
+        # a cluster that dies while starting up is left to supervise instead of being waited on
+        waits = [asyncio.ensure_future(self.ready.wait()), asyncio.ensure_future(self.process.wait())]
+        done, pending = await asyncio.wait(waits, timeout=len(self.shard_ids) * 10 + 30,
+                                           return_when=asyncio.FIRST_COMPLETED)
+        for wait in pending:
+            wait.cancel()
+
+        if not done:
+            print(f"Cluster {self.cluster_id} took too long to get ready, carrying on anyway")
+
+    async def send(self, message):
+        if self.writer is None:
+            return
+        try:
+            self.writer.write(json.dumps(message).encode() + b"\n")
+            await self.writer.drain()
+        except ConnectionError:
+            self.writer = None
+
+    # keeps the cluster running, the wait before restarting it grows while it keeps crashing straight away
+    async def supervise(self):
+        backoff = 1
+        while True:
+            started = time.monotonic()
+            code = await self.process.wait()
+            if self.launcher.closing:
+                return
+
+            if time.monotonic() - started > 60:
+                backoff = 1
+            print(f"Cluster {self.cluster_id} exited with code {code}, restarting in {backoff}s")
+            self.writer = None
+            self.guilds = 0
+            await asyncio.sleep(backoff)
+            backoff = min(backoff * 2, 60)
+
+            async with self.launcher.identify_lock:
+                await self.start()
+                await self.wait_ready()
+
+
+class Launcher:
+
+    def __init__(self, config):
+        self.config = config
+        self.port = config["cluster_ipc_port"]
+        # the socket is open to everything on the machine and the cache holds epic tokens, so only connections that
+        # know this (handed to the clusters through their environment) get to talk to the launcher
+        self.secret = secrets.token_hex(32)
+        self.shard_count = None
+        self.clusters = []
+        self.closing = False
+        self.identify_lock = asyncio.Lock()
+        self.cache = stw.SharedCache()
+
+    async def fetch_shard_count(self):
+        if self.config["cluster_shard_count"]:
+            return self.config["cluster_shard_count"]
+
+        # as many shards as discord recommends for the bot
+        async with aiohttp.ClientSession() as session:
+            async with session.get("https://discord.com/api/v10/gateway/bot",
+                                   headers={"Authorization": f"Bot {os.environ['STW_DAILY_TOKEN']}"}) as response:
+                return (await response.json())["shards"]
+
+    # splits the shards into even runs, one cluster per core unless the config says otherwise
+    def split_shards(self):
+        count = min(self.config["cluster_count"] or os.cpu_count() or 1, self.shard_count)
+        size, extra = divmod(self.shard_count, count)
+
+        ranges = []
+        start = 0
+        for cluster_id in range(count):
+            end = start + size + (1 if cluster_id < extra else 0)
+            ranges.append(list(range(start, end)))
+            start = end
+        return ranges
+
+    # the first line on a connection has to be a hello with the secret, anything else gets the connection closed
+    async def authenticate(self, reader):
+        try:
+            message = json.loads(await asyncio.wait_for(reader.readline(), 10))
+            cluster_id = message["cluster"]
+            if message["op"] != "hello" or not hmac.compare_digest(str(message["secret"]), self.secret):
+                return None
+        except (asyncio.TimeoutError, ValueError, KeyError, TypeError):
+            return None
+
+        if not isinstance(cluster_id, int) or not 0 <= cluster_id < len(self.clusters):
+            return None
+        return self.clusters[cluster_id]
+
+    # every cluster keeps one connection open, messages are a line of json each way
+    async def handle_cluster(self, reader, writer):
+        cluster = await self.authenticate(reader)
+        if cluster is None:
+            writer.close()
+            return
+
+        cluster.writer = writer
+        while line := await reader.readline():
+            message = json.loads(line)
+            op = message["op"]
+
+            if op == "ready":
+                cluster.ready.set()
+            elif op == "guilds":
+                cluster.guilds = message["count"]
+                await cluster.send({"op": "guilds", "total": sum(other.guilds for other in self.clusters)})
+            elif op == "cache_get":
+                await cluster.send({"op": "reply", "id": message["id"], "value": self.cache.get(message["key"])})
+            elif op == "cache_stats":
+                await cluster.send({"op": "reply", "id": message["id"], "value": self.cache.stats()})
+            elif op in ("cache_set", "cache_delete"):
+                if op == "cache_set":
+                    self.cache.set(message["key"], message["value"], message["ttl"])
+                else:
+                    self.cache.delete(message["key"])
+
+                # the other clusters drop their own copy and fetch it again next time
+                for other in self.clusters:
+                    if other is not cluster:
+                        await other.send({"op": "invalidate", "key": message["key"]})
+            elif op in ("reload", "load"):
+                # done where the command was used already, the rest of the clusters follow
+                for other in self.clusters:
+                    if other is not cluster:
+                        await other.send(message)
+
+        if cluster.writer is writer:
+            cluster.writer = None
+
+    async def run(self):
+        self.shard_count = await self.fetch_shard_count()
+        server = await asyncio.start_server(self.handle_cluster, "127.0.0.1", self.port)
+
+        self.clusters = [Cluster(self, cluster_id, shard_ids)
+                         for cluster_id, shard_ids in enumerate(self.split_shards())]
+        print(f"Running {self.shard_count} shards over {len(self.clusters)} clusters")
+
+        supervisors = []
+        try:
+            for cluster in self.clusters:
+                async with self.identify_lock:
+                    await cluster.start()
+                    supervisors.append(asyncio.get_event_loop().create_task(cluster.supervise()))
+                    await cluster.wait_ready()
+
+            await asyncio.gather(*supervisors)
+        finally:
+            self.closing = True
+            server.close()
+            for cluster in self.clusters:
+                if cluster.process is not None and cluster.process.returncode is None:
+                    cluster.process.terminate()
+
+
+def main():
+    launcher = Launcher(stwconfig.load("config.toml"))
+    try:
+        asyncio.run(launcher.run())
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
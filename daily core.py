@@ -1,43 +1,136 @@
 print("Starting STW Daily")
 
+import time
+
+startup_started = time.perf_counter()
+
+import asyncio
 import os
+import sys
+from collections import deque
+
 import aiohttp
 import discord
 import discord.ext.commands as ext
 from discord.ext import tasks
 
+import http_interactions
+import stwconfig
 import stwutil as stw
 
-# Compatability layer for future versions of python 3.11+ 
-try:
-    import tomllib as toml
-except ModuleNotFoundError:
-    import tomli as toml
+startup = stw.StartupProfile(startup_started)
+startup.imports["daily core"] = time.perf_counter() - startup_started
+
+
+class STWDaily(ext.AutoShardedBot):
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.command_index = stw.CommandIndex()
+
+    # keep the command index in step with cogs coming and going instead of rebuilding it after every reload
+    def add_cog(self, cog, *, override=False):
+        super().add_cog(cog, override=override)
+        self.command_index.add_cog(cog)
+
+    def remove_cog(self, name):
+        cog = super().remove_cog(name)
+        if cog is not None:
+            self.command_index.remove_cog(cog)
+        return cog
+
+    # read from the snapshot the running command started with (or the current one outside of commands), so editing
+    # config.toml, lang.toml or items.py takes effect without a restart
+    @property
+    def config(self):
+        return self.snapshots.active().config
+
+    # the colours from config are turned into usable colours when the config is compiled
+    @property
+    def colours(self):
+        return self.snapshots.active().config.colours
+
+    @property
+    def lang(self):
+        return self.snapshots.active().lang
+
+    @property
+    def items(self):
+        return self.snapshots.active().items
+
+    @property
+    def rewards(self):
+        return self.snapshots.active().rewards
 
-client = ext.AutoShardedBot(command_prefix=ext.when_mentioned, case_insensitive=True)
 
+# the lean profile only asks discord for what the commands use, no members, presences or chunking and a small
+# message cache, the default one is whatever py-cord does out of the box
+def gateway_options(config):
+    if config["gateway_profile"] != "lean":
+        return {}
 
-def load_config(config_path):
-    with open(config_path, "rb") as config_file:
-        config = toml.load(config_file)
-        config_file.close()
+    return {
+        "intents": discord.Intents(guilds=True, guild_messages=True, dm_messages=True),
+        "member_cache_flags": discord.MemberCacheFlags.none(),
+        "chunk_guilds_at_startup": False,
+        # py-cord treats 0 as the default of 1000, None is what actually turns it off
+        "max_messages": config["lean_max_messages"] or None,
+    }
 
-    return config
+
+# Loading config file, this happens before the client is made since the client keeps whichever event loop is current
+snapshots = stwconfig.SnapshotStore()
+config = snapshots.current.config
+event_loop = stw.install_event_loop_policy(config["event_loop"])
+
+# the slash commands are synced by on_connect below, only when they've changed
+client = STWDaily(command_prefix=ext.when_mentioned, case_insensitive=True, auto_sync_commands=False,
+                  **gateway_options(config))
 
 
 def main():
-    # Loading config file
-    config_path = "config.toml"
-    client.config = load_config(config_path)
+    client.snapshots = snapshots
+    client.event_loop = event_loop
+    client.gateway_profile = config["gateway_profile"]
+    client.startup = startup
+
+    # started by cluster.py, this process only runs its own range of the shards
+    client.cluster = None
+    if "STW_DAILY_CLUSTER" in os.environ:
+        client.shard_ids = [int(shard_id) for shard_id in os.environ["STW_DAILY_SHARD_IDS"].split(",")]
+        client.shard_count = int(os.environ["STW_DAILY_SHARD_COUNT"])
+        client.cluster = stw.ClusterLink(client, int(os.environ["STW_DAILY_CLUSTER"]),
+                                         int(os.environ["STW_DAILY_IPC_PORT"]), os.environ["STW_DAILY_IPC_SECRET"])
 
-    # simple way to parse the colours from config into usable colours
-    client.colours = {}
-    for name, colour in client.config["colours"].items():
-        client.colours[name] = discord.Colour.from_rgb(colour[0], colour[1], colour[2])
+    # "daily core.py http" serves slash commands and buttons over the interactions endpoint instead of the gateway
+    client.http_interactions = len(sys.argv) > 1 and sys.argv[1] == "http"
 
     client.temp_auth = {}
+    client.linked_auth = {}
+    client.session_timers = {}
+    # sessions live in here too so other clusters can pick them up, with cluster.py the launcher keeps it instead
+    client.shared_cache = stw.SharedCache()
+
+    # how long slash commands took to be acknowledged, the info command shows the average and worst of these
+    client.ack_times = deque(maxlen=client.config["ack_sample_size"])
+
+    # what the buttons under news, help and research messages need, so they keep working after a restart
+    client.view_states = stw.ViewStateStore(stw.cluster_path(client, client.config["view_state_path"]),
+                                            client.config["view_state_ttl"])
+    client.view_states.load()
     client.remove_command('help')
 
+    # the presence text each shard was last sent
+    client.presence_texts = {}
+
+    # the slash commands are synced once per process, by whichever shard connects first
+    client.sync_lock = asyncio.Lock()
+    client.commands_synced = False
+
+    # how many messages on_message has seen and how many each stage threw away
+    client.mention_prefixes = ()
+    client.message_stats = dict.fromkeys(["received", "bot_author", "no_mention", "hello", "no_command", "commands"], 0)
+
     # list of extensions for stw daily to load in
     extensions = [
         "reward",
@@ -50,17 +143,50 @@ def main():
         "homebase",
         "vbucks",
         "news",
+        "claimall",
         "reload"
     ]
 
+    # the reminders are left to the bot on the gateway
+    if client.http_interactions:
+        extensions.remove("serverext")
+
+    # some extensions only get loaded once one of their commands is used
+    deferred = client.config["deferred_extensions"]
+    client.deferred_commands = {command: extension for extension, commands in deferred.items()
+                                for command in commands}
+    extensions = [extension for extension in extensions if extension not in deferred]
+
+    # slash commands go to these guilds instead of everywhere, which discord updates straight away (for staging)
+    stw.guild_ids = list(client.config["command_guilds"]) or None
+
     # load the extensions
-    for ext in extensions:
-        print(client.load_extension(f"ext.{ext}"))
+    stw.load_extensions(client, extensions, startup)
+
+    # edits to the data files are picked up while running, 0 leaves them as they were at startup
+    if client.config["data_reload_interval"]:
+        watch_data_files.change_interval(seconds=client.config["data_reload_interval"])
+        watch_data_files.start()
+
+    if client.http_interactions:
+        run_interaction_server(f"{os.environ['STW_DAILY_TOKEN']}")
+        return
 
     update_status.start()
     client.run(f"{os.environ['STW_DAILY_TOKEN']}")
 
 
+def run_interaction_server(token):
+    server = http_interactions.InteractionServer(client)
+    try:
+        client.loop.run_until_complete(server.start(token))
+        client.loop.run_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        client.loop.run_until_complete(server.close())
+
+
 async def create_http_session():
     return aiohttp.ClientSession()
 
@@ -69,25 +195,123 @@ async def create_http_session():
 @client.event
 async def on_ready():
     client.stw_session = await create_http_session()
-    client.command_name_dict, client.command_dict, client.command_name_list = stw.create_command_dict(client)
-    print("Started STW Daily")
+    client.mention_prefixes = (f"<@{client.user.id}>", f"<@!{client.user.id}>")
+    client.startup.mark_ready()
+    print(f"Started STW Daily\n{client.startup.summary()}")
+
+    # lets the launcher start the next cluster
+    if client.cluster is not None:
+        if client.cluster.writer is None:
+            await client.cluster.connect()
+        await client.cluster.send("ready")
+
+
+# py-cord would sync the slash commands every time a shard connects, the other shards wait for the first one's sync
+# and then leave it at that (reconnects too)
+@client.event
+async def on_connect():
+    async with client.sync_lock:
+        if client.commands_synced:
+            return
+        await stw.sync_commands(client, stw.cluster_path(client, client.config["command_sync_path"]),
+                                client.startup)
+        client.commands_synced = True
+
+
+# runs right before every command, the command keeps the config it started with and slash commands are deferred here
+# before they do anything slow
+@client.before_invoke
+async def before_command(ctx):
+    client.snapshots.pin()
+    await stw.defer_interaction(client, ctx)
 
 
+# every message the bot can see lands here, so reject anything that isn't aimed at us before doing any real work
 @client.event
 async def on_message(message):
-    if '"' in message.content:
+    stats = client.message_stats
+    stats["received"] += 1
+
+    if message.author.bot:
+        stats["bot_author"] += 1
+        return
+
+    # commands and hello both start with a mention of the bot
+    content = message.content
+    if not content.startswith(client.mention_prefixes):
+        stats["no_mention"] += 1
+        return
+
+    # just a mention on its own is the hello command, punctuation after it could still be an alias like ?
+    after_mention = content.partition(">")[2]
+    if await stw.strip_string(after_mention) == "":
+        stats["hello"] += 1
+        await client.get_cog("Help").hello_command(message)
+        if after_mention.strip() == "":
+            return
+
+    if '"' in content:
         message = stw.process_quotes_in_message(message)
 
-    await client.process_commands(message)
+    # unknown invocations get mapped onto the closest command instead of every typo being an alias
+    ctx = await client.get_context(message)
+    if ctx.command is None and ctx.invoked_with and stw.load_deferred(client, ctx.invoked_with):
+        ctx = await client.get_context(message)
+    if ctx.command is None and ctx.invoked_with:
+        command_name = client.command_index.snapshot.resolve(ctx.invoked_with)
+        if command_name is not None:
+            ctx.command = client.get_command(command_name)
+
+    if ctx.command is None:
+        stats["no_command"] += 1
+        return
+
+    stats["commands"] += 1
+    await client.invoke(ctx)
 
 
-# simple task which updates the status every 60 seconds to display time until next day/reset
+# simple task which updates the status every 60 seconds to display time until next day/reset, a shard only gets sent
+# its presence again once the text would actually look different
 @tasks.loop(seconds=60)
 async def update_status():
     await client.wait_until_ready()
-    await client.change_presence(
-        activity=discord.Activity(type=discord.ActivityType.listening,
-                                  name=f"@{client.user.name}  |  Reset in: \n{stw.time_until_end_of_day()}\n  |  In {len(client.guilds)} guilds"))
+    if client.cluster is not None:
+        await client.cluster.send("guilds", count=stw.local_guild_count(client))
+
+    text = f"@{client.user.name}  |  Reset in: \n{stw.reset_clock.countdown()}\n  |  In {stw.guild_count(client)} guilds"
+    stale = [shard_id for shard_id in client.shards if client.presence_texts.get(shard_id) != text]
+    if not stale:
+        return
+
+    activity = discord.Activity(type=discord.ActivityType.listening, name=text)
+    if len(stale) == len(client.shards):
+        await client.change_presence(activity=activity)
+    else:
+        for shard_id in stale:
+            await client.change_presence(activity=activity, shard_id=shard_id)
+
+    for shard_id in stale:
+        client.presence_texts[shard_id] = text
+
+
+# a shard that had to identify again comes back without a presence
+@client.event
+async def on_shard_ready(shard_id):
+    client.presence_texts.pop(shard_id, None)
+
+
+# swaps in new versions of config.toml, lang.toml and items.py once they've been saved, a broken edit is printed and the
+# bot carries on with what it had (settings used at startup like the gateway profile still need a restart)
+@tasks.loop(seconds=5)
+async def watch_data_files():
+    try:
+        changed = await client.snapshots.reload()
+    except Exception as e:
+        print(f"Couldn't reload the data files, keeping the last working version: {e}")
+        return
+
+    if changed:
+        print(f"Reloaded {', '.join(changed)} (version {client.snapshots.current.version})")
 
 
 if __name__ == "__main__":
@@ -15,7 +15,10 @@ class Auth(ext.Cog):
 
     def __init__(self, client):
         self.client = client
-        self.emojis = client.config["emojis"]
+
+    @property
+    def emojis(self):
+        return self.client.config["emojis"]
 
     async def auth_command(self, ctx, token='', slash=False):
         white = self.client.colours["auth_white"]
@@ -35,13 +38,16 @@ class Auth(ext.Cog):
         if auth_info[0] is not None and ainfo3 != "logged_in_processing" and auth_info[2] != []:
             await stw.slash_edit_original(auth_info[0], slash, auth_info[2])
         else:
+            # every linked account, the one commands default to comes last
+            linked = self.client.linked_auth.get(ctx.author.id, {auth_info[1]['account_id']: auth_info[1]})
+            account_names = "\n".join(entry['account_name'] for entry in linked.values())
             embed = discord.Embed(title=await stw.add_emoji_title(self.client, "Currently Authenticated", "whitekey"),
                                   description=f"""\u200b
             Existing Auth Session Found For:
-            ```{auth_info[1]['account_name']}```
+            ```{account_names}```
             {self.emojis["stopwatch_anim"]} **Your auth session expires** <t:{math.floor(auth_info[1]['expiry'])}:R>
             \u200b
-            Rerun this command with a new auth code to change accounts, you can get one from:
+            Rerun this command with a new auth code to link another account (up to {self.client.config['max_linked_accounts']}), you can get one from:
             [Here if you **ARE NOT** signed into Epic Games on your browser](https://www.epicgames.com/id/logout?redirectUrl=https%3A%2F%2Fwww.epicgames.com%2Fid%2Flogin%3FredirectUrl%3Dhttps%253A%252F%252Fwww.epicgames.com%252Fid%252Fapi%252Fredirect%253FclientId%253Dec684b8c687f479fadea3cb2ad83f5c6%2526responseType%253Dcode)
             [Here if you **ARE** signed into Epic Games on your browser](https://www.epicgames.com/id/api/redirect?clientId=ec684b8c687f479fadea3cb2ad83f5c6&responseType=code)\n
             **Need Help? Run**
@@ -56,7 +62,7 @@ class Auth(ext.Cog):
     async def kill_command(self, ctx, slash=False):
         white = self.client.colours["auth_white"]
         embed = discord.Embed(title=await stw.add_emoji_title(self.client, "Killed Auth Session", "whitekey"),
-                              description=f"""```Successfully ended authentication session.```
+                              description=f"""```Successfully ended authentication session for all linked accounts.```
         """, colour=white)
         await stw.manslaughter_session(self.client, ctx.author.id, "override")
 
@@ -65,21 +71,7 @@ class Auth(ext.Cog):
         await stw.slash_send_embed(ctx, slash, embed)
 
     @ext.command(name='auth',
-                 aliases=['login', 'authenticate', "uth", "ath", "auh", "aut", 
-                          "aauth", "auuth", "autth", "authh", "uath", "atuh", 
-                          "auht", "quth", "wuth", "suth", "xuth", "zuth", "ayth",
-                          "a7th", "a8th", "aith", "akth", "ajth", "ahth", "aurh", 
-                          "au5h", "au6h", "auyh", "auhh", "augh", "aufh", "autg", 
-                          "auty", "autu", "autj", "autn", "autb", "qauth", "aquth",
-                          "wauth", "awuth", "sauth", "asuth", "xauth", "axuth", "zauth",
-                          "azuth", "ayuth", "a7uth", "au7th", "a8uth", "au8th",
-                          "aiuth", "auith", "akuth", "aukth", "ajuth", "aujth", "ahuth", 
-                          "auhth", "aurth", "autrh", "au5th", "aut5h", "au6th", "aut6h", 
-                          "auyth", "autyh", "augth",  "aufth", 
-                          "autfh", "autgh", "authg", "authy", "autuh", "authu", 
-                          "autjh", "authj", "autnh", "authn", "autbh", "authb", 'lgoin', 
-                          'authcode', 'gettoken', 'a'],
-                 
+                 aliases=['login', 'authenticate', 'authcode', 'gettoken', 'a'],
                  extras={'emoji': "keycard", 'args': {
                      'token': "The authentication token retrieved from epic games used to authenticate you to claim rewards"}},
                  brief="Authenticates you to use commands that claim your Fortnite: Save The World rewards and more.",
@@ -102,17 +94,8 @@ class Auth(ext.Cog):
         await self.auth_command(ctx, token)
 
     @ext.command(name='kill',
-                 aliases=['koll', 'ki9ll', 'imakillyou', 'k8ll', 'kkll',
-                          'mkill', 'kuill', 'end', 'oill', 'kjill', 'k8ill',
-                          'k9ill', 'bai', 'keel-over-and-dieill', 'jill',
-                          'kiol', 'klill', 'kil', 'ikll', 'kikll', 'kipl',
-                          'kilk', 'okill', 'klll', 'kilkl', 'kilol', 'kipll',
-                          'ikill', 'lkill', 'kilpl', 'mill', 'bye', 'kjll',
-                          'koill', 'baibai', 'killk', 'kilo', 'k9ll', 'kkill',
-                          'killl', 'killo', 'kll', 'killp', 'kikl', 'kioll',
-                          'iill', 'kull', 'jkill', 'kmill', 'klil', '🔪', 'kiull',
-                          'kiill', 'lill', 'kijll', 'kilp', 'ki8ll'],
-                 extras={'emoji': "whitekey", "args": {}},
+                 aliases=['end', 'bye', 'bai', 'baibai', 'imakillyou', 'keel-over-and-dieill', '🔪'],
+                 extras={'emoji': "whitekey", "args": {}, "exact_only": True},
                  brief="Ends your currently active authentication session",
                  description="This command will kill your active authentication session if any currently exist within the bot.")
     async def kill(self, ctx):
@@ -0,0 +1,91 @@
+import asyncio
+
+import discord
+import discord.ext.commands as ext
+from discord import Option
+
+import stwutil as stw
+
+
+# cog for the claimall command, daily and research in one go.
+class ClaimAll(ext.Cog):
+
+    def __init__(self, client):
+        self.client = client
+
+    # one profile query per account, then the daily and research claims go out together
+    async def claim_account(self, ctx, entry):
+        daily = self.client.get_cog("Daily")
+        research = self.client.get_cog("Research")
+
+        query_request = await stw.profile_request(self.client, "query", entry)
+        query_json = await query_request.json()
+
+        daily_embed, (research_embed, _view_state) = await asyncio.gather(daily.claim_daily(ctx, entry),
+                                                                          research.claim_research(ctx, entry,
+                                                                                                  query_json))
+        return [daily_embed, research_embed]
+
+    async def claimall_command(self, ctx, slash, authcode, auth_opt_out):
+        auth_info = await stw.get_or_create_auth_session(self.client, ctx, "claimall", authcode, slash, auth_opt_out,
+                                                         True)
+        if not auth_info[0]:
+            return
+
+        final_embeds = []
+
+        ainfo3 = ""
+        try:
+            ainfo3 = auth_info[3]
+        except:
+            pass
+
+        # the "welcome whoever" embed from logging in, if there is one
+        if ainfo3 != "logged_in_processing" and auth_info[2] != []:
+            final_embeds = auth_info[2]
+
+        accounts = await stw.session_accounts(self.client, ctx, auth_info, authcode)
+        results = await stw.bounded_gather([self.claim_account(ctx, entry) for entry in accounts],
+                                           self.client.config["linked_account_concurrency"])
+
+        # both embeds of an account are named after it when there is more than one account
+        for entry, embeds in zip(accounts, results):
+            final_embeds += await stw.label_account_embeds(accounts, embeds, [entry] * len(embeds))
+
+        # two embeds an account goes past discord's 10 a message from 5 accounts on, the rest follow in more messages
+        await stw.slash_edit_original(auth_info[0], slash, final_embeds[:10])
+        for start in range(10, len(final_embeds), 10):
+            await stw.slash_send_embed(ctx, slash, final_embeds[start:start + 10])
+        return
+
+    @ext.slash_command(name='claimall',
+                       description='Claims your daily rewards and research points at the same time (auth req.)',
+                       guild_ids=stw.guild_ids)
+    async def slashclaimall(self, ctx: discord.ApplicationContext,
+                            token: Option(str,
+                                          "The authcode to start an authentication session with if one does not exist, else this is optional") = "",
+                            auth_opt_out: Option(bool, "Opt Out of Authentication session") = False, ):
+        await self.claimall_command(ctx, True, token, not auth_opt_out)
+
+    @ext.command(name='claimall',
+                 aliases=['ca', 'all', 'everything'],
+                 extras={'emoji': "checkmark", "args": {
+                     'authcode': 'The authcode to start an authentication session with if one does not exist, if an auth session already exists this argument is optional (Optional)',
+                     'opt-out': 'Any value inputted into this field will opt you out of the authentication session system when you enter the authcode for this command (Optional)'}},
+                 brief="Claims your daily rewards and research points in one go (auth req.)",
+                 description="""This command claims your Fortnite: Save The World daily reward and your research points at the same time, you must be authenticated to use this command.
+                \u200b
+                ⦾ To spend your research points use the research command
+                """)
+    async def claimall(self, ctx, authcode='', optout=None):
+
+        if optout is not None:
+            optout = True
+        else:
+            optout = False
+
+        await self.claimall_command(ctx, False, authcode, not optout)
+
+
+def setup(client):
+    client.add_cog(ClaimAll(client))
@@ -1,5 +1,3 @@
-import datetime
-
 import discord
 import discord.ext.commands as ext
 from discord import Option
@@ -12,12 +10,12 @@ class Daily(ext.Cog):
 
     def __init__(self, client):
         self.client = client
-        self.emojis = client.config["emojis"]
 
-    async def daily_command(self, ctx, slash, authcode, auth_opt_out):
-        succ_colour = self.client.colours["success_green"]
-        yellow = self.client.colours["warning_yellow"]
+    @property
+    def emojis(self):
+        return self.client.config["emojis"]
 
+    async def daily_command(self, ctx, slash, authcode, auth_opt_out):
         auth_info = await stw.get_or_create_auth_session(self.client, ctx, "daily", authcode, slash, auth_opt_out, True)
         if not auth_info[0]:
             return
@@ -35,19 +33,28 @@ class Daily(ext.Cog):
         if ainfo3 != "logged_in_processing" and auth_info[2] != []:
             final_embeds = auth_info[2]
 
+        accounts = await stw.session_accounts(self.client, ctx, auth_info, authcode)
+        embeds = await stw.bounded_gather([self.claim_daily(ctx, entry) for entry in accounts],
+                                          self.client.config["linked_account_concurrency"])
+        final_embeds += await stw.label_account_embeds(accounts, embeds)
+        await stw.slash_edit_original(auth_info[0], slash, final_embeds)
+        return
+
+    async def claim_daily(self, ctx, entry):
+        succ_colour = self.client.colours["success_green"]
+        yellow = self.client.colours["warning_yellow"]
+
         # ok now we have the authcode information stuff, so it's time to attempt to claim daily
-        request = await stw.profile_request(self.client, "daily", auth_info[1])
+        request = await stw.profile_request(self.client, "daily", entry)
         json_response = await request.json()
-        vbucks = auth_info[1]["vbucks"]
+        vbucks = entry["vbucks"]
 
         # check for le error code
         try:
             error_code = json_response["errorCode"]
             support_url = self.client.config["support_url"]
-            acc_name = auth_info[1]["account_name"]
-            embed = await stw.post_error_possibilities(ctx, self.client, "daily", acc_name, error_code, support_url)
-            final_embeds.append(embed)
-            await stw.slash_edit_original(auth_info[0], slash, final_embeds)
+            acc_name = entry["account_name"]
+            return await stw.post_error_possibilities(ctx, self.client, "daily", acc_name, error_code, support_url)
         except:
             daily_feedback = json_response["notifications"]
 
@@ -57,11 +64,8 @@ class Daily(ext.Cog):
                     break
 
             day = daily_feedback["daysLoggedIn"]
-
-            try:
-                self.client.temp_auth[ctx.author.id]["day"] = day
-            except:
-                pass
+            entry["day"] = day
+            await stw.publish_session(self.client, ctx.author.id)
 
             items = daily_feedback["items"]
 
@@ -75,14 +79,12 @@ class Daily(ext.Cog):
                 \u200b
                 **{reward[1]} Todays reward was:**
                 ```{reward[0]}```
-                You can claim tomorrow's reward <t:{int(datetime.datetime.combine(datetime.datetime.utcnow() + datetime.timedelta(days=1), datetime.datetime.min.time()).replace(tzinfo=datetime.timezone.utc).timestamp())}:R>
+                You can claim tomorrow's reward <t:{stw.reset_clock.reset_timestamp()}:R>
                 \u200b
                 """, colour=yellow)
                 embed = await stw.set_thumbnail(self.client, embed, "warn")
                 embed = await stw.add_requested_footer(ctx, embed)
-                final_embeds.append(embed)
-                await stw.slash_edit_original(auth_info[0], slash, final_embeds)
-                return
+                return embed
 
             # Initialise the claimed embed
             embed = discord.Embed(title=await stw.add_emoji_title(self.client, "Success", "checkmark"),
@@ -140,9 +142,7 @@ class Daily(ext.Cog):
             embed = await stw.set_thumbnail(self.client, embed, "check")
 
             embed = await stw.add_requested_footer(ctx, embed)
-            final_embeds.append(embed)
-            await stw.slash_edit_original(auth_info[0], slash, final_embeds)
-            return
+            return embed
 
     @ext.slash_command(name='daily',
                        description='Allows you to claim your Fortnite: Save The World daily rewards (must be authenticated/will create)',
@@ -154,37 +154,7 @@ class Daily(ext.Cog):
         await self.daily_command(ctx, True, token, not auth_opt_out)
 
     @ext.command(name='daily',
-                 aliases=['daxily', 'clllect', 'deaily', 'clailm', 'c9llect', 'claimm', 'dai9ly', 'claiom', 'collfct',
-                          'dsily', 'colaim', 'dawily', 'claqim', 'c9ollect', 'claxim', 'dajily',
-                          'dxily', 'da8ily', 'claiim', 'cla9m', 'cla9im', 'clakim', 'cvollect', 'clollect',
-                          'collectf', 'clasim', 'dauly', 'daoly', 'daiily', 'daiply', 'dailpy', 'clai8m', 'day',
-                          'dwaily', 'coollect', 'collext', 'dailky', 'dailoy', 'clsim', 'clalm', 'coloect', 'colklect',
-                          'collec5t', 'claij', 'colelct', 'da9ily', 'daly', 'dakly', 'raily', 'collcet', 'laim', 'daioly',
-                          'coll4ct', 'collecxt', 'ckaim', 'dly', 'collecdt', 'dqily', 'dalily', 'vollect', 'caily', 'collecg',
-                          'collsect', 'cfollect', 'daqily', 'cpllect', 'calim', 'cillect', 'collec5', 'colle3ct', 'collecvt', 'colldct',
-                          'sdaily', 'claoim', 'ciollect', 'dzaily', 'draily', 'colledt', 'collrect', 'clazim', 'ckollect', 'cokllect', 'dqaily',
-                          'clainm', 'xaily', 'dcollect', 'dailt', 'daiky', 'colletc', 'dakily', 'clakm', 'co9llect', 'dsaily', 'clain', 'clqim', 'coll4ect',
-                          'collesct', 'dfaily', 'dailgy', 'xclaim', 'claim', 'collexct', 'daily6', 'aily', 'cloaim', 'cplaim', 'dailly', 'saily', 'claium', 'coplect',
-                          'daliy', 'colkect', 'vlaim', 'dailg', 'flaim', 'cla8m', 'colleft', 'dailyg', 'clqaim', 'cdaily', 'collecgt', 'clpaim', 'clauim', 'claimn', 'collwct',
-                          'colle4ct', 'collet', 'cdlaim', 'daiyl', 'adily', 'dailty', 'dzily', 'dail6', 'fclaim', 'collerct', 'coll3ct', 'cxollect', 'dail', 'dclaim',
-                          'dasily', 'dail7', 'xcollect', 'dajly', 'clami', 'collec6', 'cdollect', 'daiuly', 'collsct', 'xdaily', 'coaim', 'daioy', 'clwim', 'dwily',
-                          'coolect', 'collevct', 'clajim', 'collecy', 'cpaim', 'daily7', 'collect5', 'dailyh', 'collect', 'dally', 'ccollect', 'collecyt', 'cliam',
-                          'dlaim', 'eaily', 'claom', 'daiy', 'collech', 'fcollect', 'dollect', 'clai9m', 'clzaim', 'collectt', 'ddaily', 'da8ly',
-                          'dailyt', 'cxlaim', 'ocllect', 'collec', 'colplect', 'collecr', 'xlaim', 'collecct', 'collewct', 'dazily', 'ollect',
-                          'cvlaim', 'ckllect', 'collct', 'dieforyou', 'claimj', 'dcaily', 'colect', 'd', 'dailyu', 'collevt', 'cllect',
-                          'collecf', 'dailuy', 'vcollect', 'collpect', 'clajm', 'clalim', 'dialy', 'dailhy', 'colpect', 'collfect',
-                          'collecth', 'collec6t', 'daikly', 'clxim', 'vclaim', 'cololect', 'claik', 'deez', 'da9ly', 'rdaily',
-                          'dailyy', 'follect', 'dailjy', 'dailyj', 'clzim', 'colllect', 'collect6', 'claijm', 'colldect',
-                          'cflaim', 'claimk', 'clai', 'cclaim', 'clolect', 'caim', 'clam', 'colloect', 'dailu',
-                          'daijly', 'dai8ly', 'deeznuts', 'xollect', 'collectg', 'claum', 'clim', 'coklect',
-                          'cla8im', 'clawim', 'clxaim', 'dily', 'dailj', 'colleect', 'cpollect', 'daoily',
-                          'clwaim', 'collecrt', 'collecft', 'collefct', 'lcaim', 'claikm', 'collecty',
-                          'dxaily', 'clkaim', 'da', 'collecht', 'coll3ect', 'fdaily', 'collrct',
-                          'daaily', 'c0ollect', 'clsaim', 'collwect', 'dailh', 'c0llect',
-                          'collkect', 'cklaim', 'co0llect', 'copllect', 'colledct',
-                          'edaily', 'dail7y', 'dauily', 'cllaim', 'collectr',
-                          'claaim', 'faily', 'daipy', 'coillect',
-                          'dail6y'],
+                 aliases=['claim', 'collect', 'd', 'day', 'dieforyou', 'deez', 'deeznuts'],
                  extras={'emoji': "vbucks", "args": {
                      'authcode': 'The authcode to start an authentication session with if one does not exist, if an auth session already exists this argument is optional (Optional)',
                      'opt-out': 'Any value inputted into this field will opt you out of the authentication session system when you enter the authcode for this command (Optional)'}},
@@ -8,45 +8,41 @@ from discord.commands import (  # Importing the decorator that makes slash comma
 )
 
 
+# the select under a help message, who asked for each message lives in client.view_states
 class HelpView(discord.ui.View):
-    def __init__(self, ctx, help_options, client):
-        super().__init__()
-        self.ctx = ctx
-        self.author = ctx.author
-        self.children[0].options = help_options
+    def __init__(self, client, help_options=None):
+        super().__init__(timeout=None)
+        if help_options is not None:
+            self.children[0].options = help_options
         self.client = client
         self.interaction_check_done = {}
 
     async def interaction_check(self, interaction):
-        if self.author == interaction.user:
-            return True
-        else:
-            try:
-                already_notified = self.interaction_check_done[interaction.user.id]
-            except:
-                already_notified = False
-                self.interaction_check_done[interaction.user.id] = True
-
-            if not already_notified:
-                support_url = self.client.config["support_url"]
-                acc_name = ""
-                error_code = "errors.stwdaily.not_author_interaction_response"
-                embed = await stw.post_error_possibilities(interaction, self.client, "help", acc_name, error_code,
-                                                           support_url)
-                await interaction.response.send_message(embed=embed, ephemeral=True)
-                return False
-            else:
-                return False
+        state = self.client.view_states.get(interaction.message.id)
+        if state is None:
+            help_cog = self.client.get_cog("Help")
+            view = HelpView(self.client, await help_cog.help_options())
+            await stw.expired_view_response(self.client, interaction, view, "help")
+            return False
+
+        return await stw.check_view_author(self.client, interaction, state, self.interaction_check_done, "help")
 
     @discord.ui.select(
         placeholder="Select a help page here",
         min_values=1,
         max_values=1,
         options=[],
+        custom_id="stwdaily:help:select"
     )
     async def selected_option(self, select, interaction):
-        embed = await self.help.help_embed(self.ctx, select.values[0])
-        await interaction.response.edit_message(embed=embed, view=self)
+        help_cog = self.client.get_cog("Help")
+        command = select.values[0]
+        self.client.view_states.update(interaction.message.id)
+
+        embed = await help_cog.help_embed(interaction, command)
+        view = HelpView(self.client, await help_cog.help_options())
+        view.stop()
+        await stw.update_interaction_message(interaction, embed=embed, view=view)
 
 
 # cog for the help & hello command.
@@ -54,7 +50,17 @@ class Help(ext.Cog):
 
     def __init__(self, client):
         self.client = client
-        self.emojis = client.config["emojis"]
+
+        if client.is_ready():
+            client.add_view(HelpView(client))
+
+    @property
+    def emojis(self):
+        return self.client.config["emojis"]
+
+    @ext.Cog.listener()
+    async def on_ready(self):
+        self.client.add_view(HelpView(self.client))
 
     async def add_brief_command_info(self, embed, command):
         name_string = f"{self.emojis[command.extras['emoji']]}  {command.name}"
@@ -106,11 +112,14 @@ class Help(ext.Cog):
         embed_colour = self.client.colours["generic_blue"]
         embed = discord.Embed(colour=embed_colour, title=await stw.add_emoji_title(self.client, "Help", "info"),
                               description="\u200b")
-        
-        if inputted_command not in self.client.command_name_list:
+
+        # one snapshot for the whole lookup so a reload halfway through can't mix up the name and the command
+        commands = self.client.command_index.snapshot
+        command_name = commands.resolve(inputted_command)
+        if command_name is None:
             embed = await self.add_default_page(ctx, embed_colour)
         else:
-            command_retrieved = self.client.command_dict[self.client.command_name_dict[inputted_command]]
+            command_retrieved = commands.command_dict[command_name]
             embed = await self.add_big_command_info(ctx, embed, command_retrieved)
 
         return embed
@@ -126,38 +135,24 @@ class Help(ext.Cog):
 
         return options
 
-    async def help_command(self, ctx, command, slash=False):
-        embed = await self.help_embed(ctx, command)
+    async def help_options(self):
         help_options = [discord.SelectOption(label="all", value="main_menu",
                                              description="Display a brief amount of info about every command",
                                              emoji=self.emojis['blueinfo'], default=False)]
         help_options += await self.select_options_commands()
+        return help_options
+
+    async def help_command(self, ctx, command, slash=False):
+        embed = await self.help_embed(ctx, command)
 
-        help_view = HelpView(ctx, help_options, self.client)
-        help_view.help = self
+        help_view = HelpView(self.client, await self.help_options())
+        help_view.stop()
 
-        await stw.slash_send_embed(ctx, slash, embed, help_view)
+        message = await stw.sent_message(await stw.slash_send_embed(ctx, slash, embed, help_view))
+        self.client.view_states.put(message.id, "help", author=ctx.author.id)
 
     @ext.command(name='help',
-                 aliases=['heklp',
-                          'ghelp', 'hgelp',
-                          'h', 'hselp', 'uelp',
-                          'halp', 'heflp', 'hel',
-                          'yhelp', 'hyelp', 'heop',
-                          'hrelp', 'hedlp', 'helpl',
-                          'huelp', 'heelp', 'hhelp',
-                          'hepl', 'jelp', 'hslp',
-                          'hell', 'hlp', 'ehlp',
-                          'holp', 'h3elp',
-                          'heslp', 'nelp',
-                          'heplp', 'hwlp', 'h4lp',
-                          'hekp', 'helo', 'herlp', 'yelp',
-                          'help0', 'nhelp', 'helpp', 'bhelp',
-                          'heolp', 'huh', 'hbelp', 'he3lp', 'helop',
-                          'hwelp', 'hdlp', '?', 'hnelp', 'hep', 'hlep',
-                          'hewlp', 'h4elp', 'hrlp', 'hflp', 'jhelp', 'hdelp',
-                          'hellp', 'elp', 'helkp', 'hjelp', 'helpo', 'how', 'hel0',
-                          'hfelp', 'h3lp', 'hepp', 'hel0p', 'belp', 'uhelp', 'gelp', 'he4lp'],
+                 aliases=['h', 'halp', 'huh', 'how', '?'],
                  extras={'emoji': "info",
                          'args': {'command': "A command to display a more detailed information guide of (Optional)"}},
                  brief="Displays commands info, only the author may use the select",
@@ -194,19 +189,6 @@ class Help(ext.Cog):
         embed = await stw.set_thumbnail(self.client, embed, "calendar")
         await ctx.channel.send(embed=embed)
 
-    # the harder you climb the harder you fall
-    @ext.Cog.listener()
-    async def on_message(self, message):
-        self_id = self.client.user.id
-
-        # simple checker to see if the hello command should be triggered or not
-        if self_id in message.raw_mentions:
-            stripped_message = await stw.strip_string(message.content)
-
-            if len(stripped_message) == len(str(self_id)):
-                await self.hello_command(message)
-                return
-
 
 def setup(client):
     client.add_cog(Help(client))
@@ -11,7 +11,10 @@ class Homebase(ext.Cog):
 
     def __init__(self, client):
         self.client = client
-        self.emojis = client.config["emojis"]
+
+    @property
+    def emojis(self):
+        return self.client.config["emojis"]
 
     async def check_errors(self, ctx, public_json_response, auth_info, final_embeds, slash, name=""):
         try:
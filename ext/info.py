@@ -1,4 +1,5 @@
 import asyncio
+import math
 import os
 import time
 
@@ -17,7 +18,10 @@ class Information(ext.Cog):
 
     def __init__(self, client):
         self.client = client
-        self.emojis = client.config["emojis"]
+
+    @property
+    def emojis(self):
+        return self.client.config["emojis"]
 
     async def info_command(self, ctx, slash=False):
         try:
@@ -59,9 +63,49 @@ class Information(ext.Cog):
                                                       f'Shard: {shard_name}\n'
                                                       f'Shard Id: {shard_id}\n'
                                                       f'Total Shards: {shards}\n'
-                                                      f'Guild Count: {len(self.client.guilds)}```\u200b')
-
-        websocket_ping = '{0}'.format(int(self.client.latency * 100)) + ' ms'
+                                                      f'Event Loop: {self.client.event_loop}\n'
+                                                      f'Guild Count: {stw.guild_count(self.client)}```\u200b')
+
+        # python can't tell which shard owns what memory, so this is the process split evenly over its shards
+        process_memory = psutil.Process().memory_info().rss // 1000000
+        embed.add_field(name='Gateway memory:', value=f'```'
+                                                      f'Profile: {self.client.gateway_profile}\n'
+                                                      f'Process: {process_memory}mb\n'
+                                                      f'Per shard: {process_memory // max(len(self.client.shards), 1)}mb\n'
+                                                      f'Cached users: {len(self.client.users)}\n'
+                                                      f'Cached messages: {len(self.client.cached_messages)}```\u200b')
+
+        message_stats = self.client.message_stats
+        embed.add_field(name='Message filter:', value=f'```'
+                                                      f'Seen: {message_stats["received"]}\n'
+                                                      f'Dropped (bot author): {message_stats["bot_author"]}\n'
+                                                      f'Dropped (no mention): {message_stats["no_mention"]}\n'
+                                                      f'Dropped (no command): {message_stats["no_command"]}\n'
+                                                      f'Hello: {message_stats["hello"]}\n'
+                                                      f'Commands: {message_stats["commands"]}```\u200b', inline=False)
+
+        ack_text = "No slash commands yet"
+        ack = stw.ack_stats(self.client.ack_times)
+        if ack is not None:
+            ack_text = (f'Average: {int(ack[0])}ms\n99th percentile: {int(ack[1])}ms\n'
+                        f'Samples: {len(self.client.ack_times)}')
+        embed.add_field(name='Slash command acknowledgement:', value=f'```{ack_text}```\u200b', inline=False)
+
+        embed.add_field(name='Startup:', value=f'```{self.client.startup.summary()}```\u200b', inline=False)
+
+        cache = await stw.cache_stats(self.client)
+        if cache is not None:
+            lookups = cache["hits"] + cache["misses"]
+            hit_rate = f'{cache["hits"] / lookups * 100:.1f}%' if lookups else "Not Available"
+            embed.add_field(name='Shared cache:', value=f'```Keys: {cache["keys"]}\n'
+                                                        f'Hits: {cache["hits"]}\n'
+                                                        f'Misses: {cache["misses"]}\n'
+                                                        f'Hit rate: {hit_rate}```\u200b', inline=False)
+
+        # serving over http there's no websocket, latency is nan then
+        websocket_ping = "Not Available"
+        if not math.isnan(self.client.latency):
+            websocket_ping = '{0}'.format(int(self.client.latency * 100)) + ' ms'
         embed.add_field(name='Latency Information:', value=f'```Websocket: {websocket_ping}\n'
                                                            f'Shard: {shard_ping}\n'
                                                            f'Actual: ...```\u200b', inline=False)
@@ -79,20 +123,7 @@ class Information(ext.Cog):
         await stw.slash_edit_original(msg, slash, embed)
 
     @ext.command(name='info',
-                 aliases=['inffo',
-                          'inro', 'infoi',
-                          'infvo', 'infgo',
-                          'inf9', 'nifo',
-                          'infio', 'infko',
-                          'onfo', 'ifno',
-                          'inrfo', 'injfo', 'infpo',
-                          'unfo', 'jnfo', 'inbfo', 'infdo', 'incfo',
-                          'indfo', 'infco', 'infl', 'iknfo', 'ibfo', 'blinding-lights', 'i9nfo',
-                          'imnfo', 'info9', 'ionfo', 'inflo', 'i8nfo', 'intfo', 'inf0o', '8nfo', 'uinfo', 'inco', 'infro',
-                          'iinfo', '9info', 'infol', 'information', 'kinfo', 'nfo', 'infop', 'infk', 'innfo', 'infp', 'info0', 'indo', 'inhfo', 'ihfo', 'inof',
-                          'ingo', 'inf9o', 'ifo', 'ijnfo', 'linfo', '9nfo', 'ino', 'infoo', 'lnfo', 'invo', 'inmfo', 'ibnfo', 'infto', 'imfo', 'inf0',
-                          'knfo', 'infi', 'ilnfo', 'oinfo', 'ihnfo', 'ingfo', 'iunfo', 'jinfo', 'infok', 'le_bot_stuf',
-                          '8info', 'invfo', 'ijfo', 'into', 'inf'],
+                 aliases=['information', 'inf', 'blinding-lights', 'le_bot_stuf'],
                  extras={'emoji': "hard_drive", "args": {}},
                  brief="Get information about the bot and this shard",
                  description="This command displays information both about the shard and information about the bots hosting service along with latency. not really useful for the end user.")
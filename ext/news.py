@@ -3,27 +3,18 @@ import asyncio
 import discord
 import discord.ext.commands as ext
 from discord import Option
-import json
+from discord.ext import tasks
 
 import stwutil as stw
 
 
+# the buttons under a news message, which page each message is on lives in client.view_states
 class NewsView(discord.ui.View):
 
-    def __init__(self, client, author, context, slash, page, stw_news, stw_pages_length, br_news, br_pages_length,
-                 mode):
-        super().__init__()
+    def __init__(self, client, mode="stw"):
+        super().__init__(timeout=None)
         self.client = client
-        self.context = context
-        self.author = author
         self.interaction_check_done = {}
-        self.slash = slash
-        self.page = page
-        self.mode = mode
-        self.stw_news = stw_news
-        self.stw_pages_length = stw_pages_length
-        self.br_news = br_news
-        self.br_pages_length = br_pages_length
 
         self.button_emojis = {
             'prev': self.client.config["emojis"]["left_icon"],
@@ -33,97 +24,60 @@ class NewsView(discord.ui.View):
         }
 
         self.children = list(map(self.map_button_emojis, self.children))
+        self.children[2].disabled = mode == "stw"
+        self.children[3].disabled = mode == "br"
 
     def map_button_emojis(self, button):
         button.emoji = self.button_emojis[button.emoji.name]
         return button
 
-    async def on_timeout(self):
-        if self.mode == "stw":
-            embed = await stw.create_news_page(self, self.context, self.stw_news, self.page, self.stw_pages_length)
-            embed = await stw.set_thumbnail(self.client, embed, "clown")
-            embed = await stw.add_requested_footer(self.context, embed)
-        else:
-            embed = await stw.create_news_page(self, self.context, self.br_news, self.page, self.br_pages_length)
-            embed = await stw.set_thumbnail(self.client, embed, "clown")
-            embed = await stw.add_requested_footer(self.context, embed)
-        for button in self.children:
-            button.disabled = True
-        await self.message.edit(embed=embed, view=self)
+    async def show_page(self, interaction, mode, page):
+        news = await self.client.news_cache.get()
+        page = news.clamp_page(mode, page)
+        self.client.view_states.update(interaction.message.id, mode=mode, page=page)
+
+        embed = await news.page_embed(self.client, interaction, mode, page)
+        view = NewsView(self.client, mode)
+        view.stop()
+        await stw.update_interaction_message(interaction, embed=embed, view=view)
         return
 
     async def change_page(self, interaction, action):
+        state = self.client.view_states.get(interaction.message.id)
+        page = state["page"]
         if action == "next":
-            self.page += 1
+            page += 1
         elif action == "prev":
-            self.page -= 1
-        if self.mode == "stw":
-            self.page = ((self.page - 1) % self.stw_pages_length) + 1
-            embed = await stw.create_news_page(self, self.context, self.stw_news, self.page, self.stw_pages_length)
-            embed = await stw.set_thumbnail(self.client, embed, "clown")
-            embed = await stw.add_requested_footer(self.context, embed)
-        else:
-            self.page = ((self.page - 1) % self.br_pages_length) + 1
-            embed = await stw.create_news_page(self, self.context, self.br_news, self.page, self.br_pages_length)
-            embed = await stw.set_thumbnail(self.client, embed, "clown")
-            embed = await stw.add_requested_footer(self.context, embed)
-        await interaction.response.edit_message(embed=embed, view=self)
+            page -= 1
+        await self.show_page(interaction, state["mode"], page)
         return
 
     async def change_mode(self, interaction, mode):
-        if mode == "stw":
-            self.mode = "stw"
-            self.page = 1
-            embed = await stw.create_news_page(self, self.context, self.stw_news, self.page, self.stw_pages_length)
-            embed = await stw.set_thumbnail(self.client, embed, "clown")
-            embed = await stw.add_requested_footer(self.context, embed)
-            self.children[2].disabled = True
-            self.children[3].disabled = False
-        else:
-            self.mode = "br"
-            self.page = 1
-            embed = await stw.create_news_page(self, self.context, self.br_news, self.page, self.br_pages_length)
-            embed = await stw.set_thumbnail(self.client, embed, "clown")
-            embed = await stw.add_requested_footer(self.context, embed)
-            self.children[2].disabled = False
-            self.children[3].disabled = True
-        await interaction.response.edit_message(embed=embed, view=self)
+        await self.show_page(interaction, mode, 1)
         return
 
     async def interaction_check(self, interaction):
-        if self.author == interaction.user:
-            return True
-        else:
-            try:
-                already_notified = self.interaction_check_done[interaction.user.id]
-            except:
-                already_notified = False
-                self.interaction_check_done[interaction.user.id] = True
-
-            if not already_notified:
-                support_url = self.client.config["support_url"]
-                acc_name = ""
-                error_code = "errors.stwdaily.not_author_interaction_response"
-                embed = await stw.post_error_possibilities(interaction, self.client, "news", acc_name, error_code,
-                                                           support_url)
-                await interaction.response.send_message(embed=embed, ephemeral=True)
-                return False
-            else:
-                return False
-
-    @discord.ui.button(style=discord.ButtonStyle.primary, emoji="prev", row=0)
+        state = self.client.view_states.get(interaction.message.id)
+        if state is None:
+            await stw.expired_view_response(self.client, interaction, NewsView(self.client), "news")
+            return False
+
+        return await stw.check_view_author(self.client, interaction, state, self.interaction_check_done, "news")
+
+    @discord.ui.button(style=discord.ButtonStyle.primary, emoji="prev", row=0, custom_id="stwdaily:news:prev")
     async def prev_button(self, _button, interaction):
         await self.change_page(interaction, "prev")
 
-    @discord.ui.button(style=discord.ButtonStyle.primary, emoji="next", row=0)
+    @discord.ui.button(style=discord.ButtonStyle.primary, emoji="next", row=0, custom_id="stwdaily:news:next")
     async def next_button(self, _button, interaction):
         await self.change_page(interaction, "next")
 
-    @discord.ui.button(style=discord.ButtonStyle.secondary, emoji="stw", disabled=True, row=1)
+    @discord.ui.button(style=discord.ButtonStyle.secondary, emoji="stw", disabled=True, row=1,
+                       custom_id="stwdaily:news:stw")
     async def stw_button(self, _button, interaction):
         await self.change_mode(interaction, "stw")
 
-    @discord.ui.button(style=discord.ButtonStyle.secondary, emoji="br", row=1)
+    @discord.ui.button(style=discord.ButtonStyle.secondary, emoji="br", row=1, custom_id="stwdaily:news:br")
     async def br_button(self, _button, interaction):
         await self.change_mode(interaction, "br")
 
@@ -133,28 +87,50 @@ class News(ext.Cog):
 
     def __init__(self, client):
         self.client = client
-        self.emojis = client.config["emojis"]
+
+        # the cache lives on the client so reloading this cog keeps the news it already has
+        try:
+            self.news_cache = client.news_cache
+        except AttributeError:
+            news_cache_path = stw.cluster_path(client, client.config["news_cache_path"])
+            self.news_cache = client.news_cache = stw.NewsCache(client, news_cache_path)
+            self.news_cache.load()
+
+        self.refresh_news.change_interval(seconds=client.config["news_refresh_time"])
+        self.refresh_news.start()
+
+        if client.is_ready():
+            client.add_view(NewsView(client))
+
+    @property
+    def emojis(self):
+        return self.client.config["emojis"]
+
+    @ext.Cog.listener()
+    async def on_ready(self):
+        self.client.add_view(NewsView(self.client))
+
+    def cog_unload(self):
+        self.refresh_news.cancel()
+
+    # keeps the news fresh so the command itself never has to wait on epic
+    @tasks.loop(seconds=900)
+    async def refresh_news(self):
+        await self.client.wait_until_ready()
+        await self.news_cache.background_refresh()
 
     async def news_command(self, ctx, slash, page, mode):
-        stw_news_req = await stw.get_stw_news(self.client)
-        stw_news_json = await stw_news_req.json(content_type=None)
-        stw_news = stw_news_json["news"]["messages"]
-        stw_pages_length = len(stw_news)
-        br_news_req = await stw.get_br_news(self.client)
-        br_news_json = await br_news_req.json(content_type=None)
-        br_news = br_news_json["data"]["motds"]
-        br_pages_length = len(br_news)
-
-        if mode == "br":
-            embed = await stw.create_news_page(self, ctx, br_news, page, br_pages_length)
-        else:
-            embed = await stw.create_news_page(self, ctx, stw_news, page, stw_pages_length)
-        embed = await stw.set_thumbnail(self.client, embed, "clown")
-        embed = await stw.add_requested_footer(ctx, embed)
-
-        news_view = NewsView(self.client, ctx.author, ctx, slash, page, stw_news, stw_pages_length, br_news,
-                             br_pages_length, mode)
-        await stw.slash_send_embed(ctx, slash, embed, news_view)
+        news = await self.news_cache.get()
+        if mode != "br":
+            mode = "stw"
+        page = news.clamp_page(mode, int(page))
+
+        embed = await news.page_embed(self.client, ctx, mode, page)
+
+        news_view = NewsView(self.client, mode)
+        news_view.stop()
+        message = await stw.sent_message(await stw.slash_send_embed(ctx, slash, embed, news_view))
+        self.client.view_states.put(message.id, "news", author=ctx.author.id, mode=mode, page=page)
         return
 
     @ext.slash_command(name='news',
@@ -13,6 +13,9 @@ class Reload(ext.Cog):
     async def reload_command(self, ctx, extension, slash=False):
         try:
             self.client.reload_extension(f"ext.{extension}")
+            # the other clusters do the same so they don't end up running different code
+            if self.client.cluster is not None:
+                await self.client.cluster.send("reload", extension=extension)
             embed_colour = self.client.colours["auth_white"]
             embed = discord.Embed(title=await stw.add_emoji_title(self.client, "Reload cog", "hard_drive"),
                                   description=f'\u200b\nReloaded cog: {extension}\n\u200b',
@@ -33,12 +36,15 @@ class Reload(ext.Cog):
                  extras={'emoji': "hard_drive", "args": {'ext': 'The cog to reload'}},
                  brief="reloads cogs",
                  description="Reloads cogs to apply changes")
+    @ext.is_owner()
     async def rlcg(self, ctx, extension):
         await self.reload_command(ctx, extension)
 
     async def load_command(self, ctx, extension, slash=False):
         try:
             self.client.load_extension(f"ext.{extension}")
+            if self.client.cluster is not None:
+                await self.client.cluster.send("load", extension=extension)
             embed_colour = self.client.colours["auth_white"]
             embed = discord.Embed(title=await stw.add_emoji_title(self.client, "Load cog", "hard_drive"),
                                   description=f'\u200b\nLoaded cog: {extension}\n\u200b',
@@ -59,9 +65,40 @@ class Reload(ext.Cog):
                  extras={'emoji': "hard_drive", "args": {'ext': 'The cog to load'}},
                  brief="loads cogs",
                  description="Loads cogs to apply changes")
+    @ext.is_owner()
     async def lcg(self, ctx, extension):
         await self.load_command(ctx, extension)
 
+    async def reload_data_command(self, ctx, slash=False):
+        try:
+            # goes through the same checks as the watcher, the files are read again even if they look unchanged
+            changed = await self.client.snapshots.reload(force=True)
+            embed_colour = self.client.colours["auth_white"]
+            embed = discord.Embed(title=await stw.add_emoji_title(self.client, "Reload data", "hard_drive"),
+                                  description=f'\u200b\nReloaded: {", ".join(changed)}\n'
+                                              f'Version: {self.client.snapshots.current.version}\n\u200b',
+                                  color=embed_colour)
+        except Exception as e:
+            embed_colour = self.client.colours["error_red"]
+            embed = discord.Embed(title=await stw.add_emoji_title(self.client, "Reload data", "hard_drive"),
+                                  description=f'\u200b\nFailed to reload data, still using version '
+                                              f'{self.client.snapshots.current.version}\n\u200b',
+                                  color=embed_colour)
+            embed.add_field(name="Error:", value=f"```{e}```", inline=False)
+
+        embed = await stw.set_thumbnail(self.client, embed, "keycard")
+        embed = await stw.add_requested_footer(ctx, embed)
+
+        await stw.slash_send_embed(ctx, slash, embed)
+
+    @ext.command(name='rldata',
+                 extras={'emoji': "hard_drive", "args": {}},
+                 brief="reloads config, lang and items",
+                 description="Reloads config.toml, lang.toml and items.py without restarting")
+    @ext.is_owner()
+    async def rldata(self, ctx):
+        await self.reload_data_command(ctx)
+
 
 def setup(client):
     client.add_cog(Reload(client))
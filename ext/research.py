@@ -1,4 +1,6 @@
 import asyncio
+import math
+import time
 
 import discord
 import discord.ext.commands as ext
@@ -32,185 +34,360 @@ async def add_fort_fields(client, embed, current_levels, extra_white_space=False
     return embed
 
 
+# the buttons under a research message, all the state lives in client.view_states
 class ResearchView(discord.ui.View):
 
-    def map_button_emojis(self, button):
-        button.emoji = self.button_emojis[button.emoji.name]
-        return button
+    def __init__(self, client, disabled=False, amount=1):
+        super().__init__(timeout=None)
+        self.client = client
+        self.interaction_check_done = {}
 
-    async def on_timeout(self):
-        gren = self.client.colours["research_green"]
+        self.button_emojis = {
+            'fortitude': self.client.config["emojis"]["fortitude"],
+            'offense': self.client.config["emojis"]['offense'],
+            'resistance': self.client.config["emojis"]['resistance'],
+            'technology': self.client.config["emojis"]['technology'],
+            'research_point': self.client.config["emojis"]['research_point']
+        }
 
+        self.children = list(map(self.map_button_emojis, self.children))
         for child in self.children:
-            child.disabled = True
-        total_points = self.total_points
-        current_levels = self.current_levels
-        embed = discord.Embed(
-            title=await stw.add_emoji_title(self.client, "Research", "research_point"),
-            description=f"""\u200b
-            You currently have **{total_points['quantity']}** research point{'s' if total_points['quantity'] > 1 else ''} available.\n\u200b\n\u200b""",
-            colour=gren
-        )
+            child.disabled = disabled
+        self.children[5].placeholder = f"Levels bought per press: {amount or 'max'}"
 
-        embed = await stw.set_thumbnail(self.client, embed, "research")
-        embed = await stw.add_requested_footer(self.context, embed)
-        embed = await add_fort_fields(self.client, embed, current_levels)
-        embed.add_field(name=f"\u200b", value=f"*Timed out, please reuse the command to continue.*\n\u200b")
-        await self.message.edit(embed=embed, view=self)
-        return
+    def map_button_emojis(self, button):
+        if isinstance(button, discord.ui.Button):
+            button.emoji = self.button_emojis[button.emoji.name]
+        return button
 
-    async def universal_stat_process(self, interaction, stat):
-        gren = self.client.colours["research_green"]
+    async def interaction_check(self, interaction):
+        state = self.client.view_states.get(interaction.message.id)
+        if state is None:
+            await stw.expired_view_response(self.client, interaction, ResearchView(self.client), "research")
+            return False
 
-        for child in self.children:
-            child.disabled = True
-        await interaction.response.edit_message(view=self)
+        if not await stw.check_view_author(self.client, interaction, state, self.interaction_check_done, "research"):
+            return False
 
-        stat_purchase = await stw.profile_request(self.client, "purchase_research", self.auth_info[1],
-                                                  json={'statId': stat})
-        purchased_json = await stat_purchase.json()
+        if await self.client.get_cog("Research").view_entry(interaction.message.id, state) is None:
+            await stw.expired_view_response(self.client, interaction, ResearchView(self.client), "research",
+                                            "errors.stwdaily.view_session_ended", state["account_name"])
+            return False
 
-        total_points = self.total_points
-        current_levels = self.current_levels
+        return True
 
-        for child in self.children:
-            child.disabled = False
+    # the state can still run out between the check and the press being handled
+    async def session(self, interaction):
+        session = await self.client.get_cog("Research").research_session(interaction.message)
+        if session is None:
+            await stw.expired_view_response(self.client, interaction, ResearchView(self.client), "research")
+        return session
 
-        try:
-            if purchased_json['errorCode'] == 'errors.com.epicgames.fortnite.item_consumption_failed':
-                embed = discord.Embed(
-                    title=await stw.add_emoji_title(self.client, "Research", "research_point"),
-                    description=f"""\u200b
-                    You currently have **{total_points['quantity']}** research point{'s' if total_points['quantity'] > 1 else ''} available.\n\u200b\n\u200b""",
-                    colour=gren
-                )
-
-                embed = await stw.set_thumbnail(self.client, embed, "research")
-                embed = await stw.add_requested_footer(interaction, embed)
-                embed = await add_fort_fields(self.client, embed, current_levels)
-                embed.add_field(name=f"\u200b", value=f"*You do not have enough points to level up **{stat}***\n\u200b")
-                await interaction.edit_original_response(embed=embed, view=self)
-                return
-        except:
-            pass
+    async def universal_stat_process(self, interaction, stat):
+        session = await self.session(interaction)
+        if session is not None:
+            await session.press(interaction, stat)
 
-        current_research_statistics_request = await stw.profile_request(self.client, "query", self.auth_info[1])
-        json_response = await current_research_statistics_request.json()
-        current_levels = await research_query(interaction, self.client, self.auth_info, self.slash, [], json_response)
-        if current_levels is None:
-            return
+    @discord.ui.button(style=discord.ButtonStyle.success, emoji="fortitude", row=0,
+                       custom_id="stwdaily:research:fortitude")
+    async def fortitude_button(self, _button, interaction):
+        await self.universal_stat_process(interaction, "fortitude")
 
-        self.current_levels = current_levels
+    @discord.ui.button(style=discord.ButtonStyle.success, emoji="offense", row=0,
+                       custom_id="stwdaily:research:offense")
+    async def offense_button(self, _button, interaction):
+        await self.universal_stat_process(interaction, "offense")
 
-        # What I believe happens is that epic games removes the research points item if you use it all... not to sure if they change the research token guid
-        try:
-            research_points_item = purchased_json['profileChanges'][0]['profile']['items'][self.research_token_guid]
-        except:
-            print(purchased_json)
-            embed = discord.Embed(
-                title=await stw.add_emoji_title(self.client, "Research", "research_point"),
-                description=f"""\u200b
-                You currently have **0** research points available.\n\u200b\n\u200b""",
-                colour=gren
-            )
-
-            embed = await add_fort_fields(self.client, embed, current_levels)
-            embed.add_field(name=f"\u200b", value=f"*No more research points!*\n\u200b")
-            embed = await stw.set_thumbnail(self.client, embed, "research")
-            embed = await stw.add_requested_footer(interaction, embed)
-            for child in self.children:
-                child.disabled = True
-            await interaction.edit_original_response(embed=embed, view=self)
-            return
+    @discord.ui.button(style=discord.ButtonStyle.success, emoji="resistance", row=0,
+                       custom_id="stwdaily:research:resistance")
+    async def resistance_button(self, _button,  interaction):
+        await self.universal_stat_process(interaction, "resistance")
+
+    @discord.ui.button(style=discord.ButtonStyle.success, emoji="technology", row=0,
+                       custom_id="stwdaily:research:technology")
+    async def technology_button(self, _button,  interaction):
+        await self.universal_stat_process(interaction, "technology")
+
+    @discord.ui.button(style=discord.ButtonStyle.primary, emoji="research_point", label="Spend evenly", row=0,
+                       custom_id="stwdaily:research:even")
+    async def even_button(self, _button, interaction):
+        await self.universal_stat_process(interaction, None)
+
+    @discord.ui.select(
+        placeholder="Levels bought per press: 1",
+        min_values=1,
+        max_values=1,
+        options=[discord.SelectOption(label=f"Buy {amount} level{'s' if amount != 1 else ''} per press", value=amount)
+                 for amount in ["1", "5", "10", "25"]] +
+                [discord.SelectOption(label="Buy as many levels as possible per press", value="max")],
+        row=1,
+        custom_id="stwdaily:research:amount"
+    )
+    async def amount_select(self, select, interaction):
+        amount = None if select.values[0] == "max" else int(select.values[0])
+        session = await self.session(interaction)
+        if session is not None:
+            await session.set_amount(interaction, amount)
+
+
+# what's going on under one research message while its buttons are being pressed, built from client.view_states
+# when the first press comes in and dropped again once everything queued has been bought and drawn
+class ResearchSession:
+
+    def __init__(self, client, cog, message, state, entry):
+        self.client = client
+        self.cog = cog
+        self.message = message
+        self.entry = entry
+        self.context = None
+        self.current_levels = dict(state["levels"])
+        self.points = state["points"]
+        self.research_token_guid = state["token_guid"]
+        # how many levels each button press buys, None for as many as possible
+        self.amount = state["amount"]
+
+        # presses waiting to be bought, and what's needed to guess what they will do before they are
+        self.pending = []
+        self.worker = None
+        self.rvn = state["rvn"]
+        self.last_cost = state["last_cost"]
+        self.bought = dict.fromkeys(self.current_levels, 0)
+        self.spent = 0
+
+        # debounced message edits
+        self.note = state["note"]
+        self.dirty = False
+        self.renderer = None
+
+    # writes everything worth keeping back to the store
+    def save(self):
+        self.client.view_states.update(self.message.id, levels=self.current_levels, points=self.points,
+                                       rvn=self.rvn, last_cost=self.last_cost, amount=self.amount, note=self.note)
+
+    async def research_embed(self, ctx, note):
+        gren = self.client.colours["research_green"]
+        levels, points = self.optimistic_state()
 
-        spent_points = self.total_points['quantity'] - research_points_item['quantity']
         embed = discord.Embed(
             title=await stw.add_emoji_title(self.client, "Research", "research_point"),
             description=f"""\u200b
-            You currently have **{research_points_item['quantity']}** research point{'s' if research_points_item['quantity'] > 1 else ''} available.\n\u200b\n\u200b""",
+            You currently have **{points}** research point{'s' if points != 1 else ''} available.\n\u200b\n\u200b""",
             colour=gren
         )
 
-        embed = await add_fort_fields(self.client, embed, current_levels)
-        embed.add_field(name=f"\u200b", value=f"*Spent **{spent_points}** to level up **{stat}***\n\u200b")
+        embed = await add_fort_fields(self.client, embed, levels)
+        embed.add_field(name=f"\u200b", value=f"{note}\n\u200b")
         embed = await stw.set_thumbnail(self.client, embed, "research")
-        embed = await stw.add_requested_footer(interaction, embed)
-        self.total_points = research_points_item
+        embed = await stw.add_requested_footer(ctx, embed)
+        return embed
 
-        await interaction.edit_original_response(embed=embed, view=self)
+    # the confirmed levels and points plus whatever is still queued up, guessed using what the last level cost
+    def optimistic_state(self):
+        levels = dict(self.current_levels)
+        points = self.points
 
-    # creo kinda fire though ngl
-    def __init__(self, client, auth_info, author, total_points, current_levels, research_token_guid, context, slash):
-        super().__init__()
-        self.client = client
-        self.context = context
-        self.auth_info = auth_info
-        self.author = author
-        self.interaction_check_done = {}
-        self.total_points = total_points
-        self.current_levels = current_levels
-        self.research_token_guid = research_token_guid
-        self.slash = slash
+        for stat, amount in self.pending:
+            # no way to guess how spreading evenly or buying as much as possible will go
+            if stat is None or amount is None:
+                continue
 
-        self.button_emojis = {
-            'fortitude': self.client.config["emojis"]["fortitude"],
-            'offense': self.client.config["emojis"]['offense'],
-            'resistance': self.client.config["emojis"]['resistance'],
-            'technology': self.client.config["emojis"]['technology']
-        }
+            for _ in range(amount):
+                if levels[stat] >= max_stat_level or (self.last_cost is not None and points < self.last_cost):
+                    break
+                levels[stat] += 1
+                if self.last_cost is not None:
+                    points -= self.last_cost
+
+        return levels, points
+
+    # picks the next stat to level, None when there's nothing left that can be levelled
+    def next_stat(self, stat):
+        if stat is not None:
+            return stat if self.current_levels[stat] < max_stat_level else None
+
+        # spreading evenly just means always levelling whichever stat is lowest
+        stat = min(self.current_levels, key=self.current_levels.get)
+        return stat if self.current_levels[stat] < max_stat_level else None
+
+    async def set_amount(self, interaction, amount):
+        self.amount = amount
+        self.save()
+
+        view = ResearchView(self.client, amount=amount)
+        view.stop()
+        await stw.update_interaction_message(interaction, view=view)
+
+        # a render still waiting to go out takes care of dropping the session once it's drawn the last of the purchases
+        if (self.worker is None or self.worker.done()) and (self.renderer is None or self.renderer.done()):
+            self.cog.sessions.pop(self.message.id, None)
+
+    # presses are only acknowledged here, the purchases happen one after the other in process_queue and the message
+    # is redrawn by render, so mashing a button costs neither an edit nor a wait per press
+    async def press(self, interaction, stat):
+        if not interaction.response.is_done():
+            await interaction.response.defer()
+        self.context = interaction
+
+        # spending evenly always spends everything
+        amount = self.amount if stat is not None else None
+        self.pending.append((stat, amount))
+        self.note = f"*Levelling up... {len(self.pending)} queued*"
+        self.request_render()
+
+        # the summary covers every press since the queue was last empty
+        if self.worker is None or self.worker.done():
+            self.bought = dict.fromkeys(self.current_levels, 0)
+            self.spent = 0
+            self.worker = asyncio.get_event_loop().create_task(self.process_queue())
+
+    async def process_queue(self):
+        try:
+            while self.pending:
+                stat, amount = self.pending.pop(0)
+                if not await self.buy_levels(stat, amount):
+                    return
+        except Exception as e:
+            # epic erroring or timing out halfway through, otherwise the message is left on "levelling up..." for good
+            print(f"Research purchase failed for message {self.message.id}: {e}")
+            await self.fail("errors.stwdaily.research_purchase_failed")
+            return
 
-        self.children = list(map(self.map_button_emojis, self.children))
+        self.save()
+        self.request_render()
+
+    # swaps the message for an error, everything still queued is dropped and the buttons go with it
+    async def fail(self, error_code):
+        self.pending.clear()
+        embed = await stw.post_error_possibilities(self.context, self.client, "research", self.entry["account_name"],
+                                                   error_code, self.client.config["support_url"])
+        self.cog.sessions.pop(self.message.id, None)
+        self.client.view_states.remove(self.message.id)
+        await stw.edit_message(self.message, embed=embed, view=None)
+
+    # buys up to amount levels one after the other, each purchase sends the profile revision from the last one so
+    # epic only sends back what changed instead of the whole profile
+    async def buy_levels(self, stat, amount):
+        amount_text = amount or "max"
+        if amount is None:
+            amount = max_stat_level * 4
+
+        state = {"levels": dict(self.current_levels), "points": self.points, "rvn": self.rvn}
+        note = None
+
+        for count in range(amount):
+            next_stat = self.next_stat(stat)
+            if next_stat is None:
+                break
+
+            stat_purchase = await stw.profile_request(self.client, "purchase_research", self.entry,
+                                                      json={'statId': next_stat}, rvn=state["rvn"])
+            purchased_json = await stat_purchase.json()
 
-    async def interaction_check(self, interaction):
-        if self.author == interaction.user:
-            return True
-        else:
             try:
-                already_notified = self.interaction_check_done[interaction.user.id]
+                error_code = purchased_json['errorCode']
             except:
-                already_notified = False
-                self.interaction_check_done[interaction.user.id] = True
-
-            if not already_notified:
-                support_url = self.client.config["support_url"]
-                acc_name = ""
-                error_code = "errors.stwdaily.not_author_interaction_response"
-                embed = await stw.post_error_possibilities(interaction, self.client, "research", acc_name, error_code,
-                                                           support_url)
-                await interaction.response.send_message(embed=embed, ephemeral=True)
-                return False
-            else:
+                error_code = None
+
+            if error_code == 'errors.com.epicgames.fortnite.item_consumption_failed':
+                note = f"*You do not have enough points to level up **{next_stat}***"
+                break
+            elif error_code is not None:
+                await self.fail(error_code)
                 return False
 
-    @discord.ui.button(style=discord.ButtonStyle.success, emoji="fortitude")
-    async def fortitude_button(self, _button, interaction):
-        await self.universal_stat_process(interaction, "fortitude")
+            points_before = state["points"]
+            await asyncio.to_thread(apply_research_changes, state, purchased_json, self.research_token_guid)
+            self.rvn = state["rvn"]
+            self.last_cost = points_before - state["points"]
+            self.spent += self.last_cost
+            self.bought[next_stat] += 1
+            self.current_levels = dict(state["levels"])
+            self.points = state["points"]
+
+            self.note = f"*Levelling up... bought **{count + 1}** of **{amount_text}***"
+            self.request_render()
+
+        levelled = ", ".join(f"**{name}** +{levels}" for name, levels in self.bought.items() if levels)
+        if levelled:
+            summary = f"*Spent **{self.spent}** to level up {levelled}*"
+            note = summary if note is None else f"{summary}\n{note}"
+        elif note is None:
+            note = "*There is nothing left to level up*"
+
+        self.note = note
+        self.request_render()
+        return True
+
+    def request_render(self):
+        self.dirty = True
+        if self.renderer is None or self.renderer.done():
+            self.renderer = asyncio.get_event_loop().create_task(self.render())
+
+    # everything that changes within one debounce window ends up in a single edit
+    async def render(self):
+        while self.dirty:
+            await asyncio.sleep(self.client.config["research_progress_interval"])
+            self.dirty = False
+            if self.cog.sessions.get(self.message.id) is not self:
+                return
 
-    @discord.ui.button(style=discord.ButtonStyle.success, emoji="offense")
-    async def offense_button(self, _button, interaction):
-        await self.universal_stat_process(interaction, "offense")
+            # buttons stay usable while purchases are queued, they only switch off once there's nothing left to buy
+            busy = bool(self.pending) or (self.worker is not None and not self.worker.done())
+            maxed = sum(self.current_levels.values()) >= max_stat_level * 4
+            view = ResearchView(self.client, not busy and (maxed or self.points == 0), self.amount)
+            view.stop()
 
-    @discord.ui.button(style=discord.ButtonStyle.success, emoji="resistance")
-    async def resistance_button(self, _button,  interaction):
-        await self.universal_stat_process(interaction, "resistance")
+            embed = await self.research_embed(self.context, self.note)
+            await stw.edit_message(self.message, embed=embed, view=view)
+
+        # nothing left to do, the store has everything needed to pick this back up
+        if not self.pending and (self.worker is None or self.worker.done()):
+            self.cog.sessions.pop(self.message.id, None)
+
+
+# research levels stop at 120 for each of the four stats
+max_stat_level = 120
 
-    @discord.ui.button(style=discord.ButtonStyle.success, emoji="technology")
-    async def technology_button(self, _button,  interaction):
-        await self.universal_stat_process(interaction, "technology")
 
+# applies a research purchase response onto state, which holds the levels, points and profile revision
+# epic sends the whole profile if no revision was given and only what changed when one was
+def apply_research_changes(state, response_json, research_token_guid):
+    for change in response_json.get('profileChanges', []):
+        change_type = change.get('changeType')
 
-async def research_query(ctx, client, auth_info, slash, final_embeds, json_response):
+        if change_type == 'fullProfileUpdate':
+            profile = change['profile']
+            state["levels"].update(profile['stats']['attributes'].get('research_levels', {}))
+            # epic removes the research points item when all of it gets used
+            try:
+                state["points"] = profile['items'][research_token_guid]['quantity']
+            except KeyError:
+                state["points"] = 0
+
+        elif change_type == 'statModified' and change.get('name') == 'research_levels':
+            state["levels"].update(change['value'])
+
+        elif change_type == 'itemQuantityChanged' and change.get('itemId') == research_token_guid:
+            state["points"] = change['quantity']
+
+        elif change_type == 'itemRemoved' and change.get('itemId') == research_token_guid:
+            state["points"] = 0
+
+    state["rvn"] = response_json.get('profileRevision', state["rvn"])
+    return state
+
+
+# returns the current levels, or None and the embed to show instead when there is nothing left to research
+async def research_query(ctx, client, entry, json_response):
     crown_yellow = client.colours["crown_yellow"]
 
     support_url = client.config["support_url"]
-    acc_name = auth_info[1]["account_name"]
+    acc_name = entry["account_name"]
 
     try:
         error_code = json_response["errorCode"]
         embed = await stw.post_error_possibilities(ctx, client, "research", acc_name, error_code, support_url)
-        final_embeds.append(embed)
-        await stw.slash_edit_original(auth_info[0], slash, final_embeds)
-        return
+        return None, embed
     except:
         pass
 
@@ -229,9 +406,7 @@ async def research_query(ctx, client, auth_info, slash, final_embeds, json_respo
             # account doesn't have stw
             error_code = "errors.com.epicgames.fortnite.check_access_failed"
             embed = await stw.post_error_possibilities(ctx, client, "research", acc_name, error_code, support_url)
-            final_embeds.append(embed)
-            await stw.slash_edit_original(auth_info[0], slash, final_embeds)
-            return
+            return None, embed
 
     # I'm not too sure what happens here but if current_levels doesn't exist im assuming its at maximum.
     proc_max = False
@@ -257,11 +432,9 @@ async def research_query(ctx, client, auth_info, slash, final_embeds, json_respo
         await add_fort_fields(client, embed, current_levels, True)
         embed = await stw.set_thumbnail(client, embed, "crown")
         embed = await stw.add_requested_footer(ctx, embed)
-        final_embeds.append(embed)
-        await stw.slash_edit_original(auth_info[0], slash, final_embeds)
-        return None
+        return None, embed
 
-    return current_levels
+    return current_levels, None
 
 
 # cog for the research related commands.
@@ -269,10 +442,52 @@ class Research(ext.Cog):
 
     def __init__(self, client):
         self.client = client
-        self.emojis = client.config["emojis"]
         self.token_guid_research = "Token_collectionresource_nodegatetoken01"
         self.item_templateid_research = "Token:collectionresource_nodegatetoken01"
 
+        # research messages with something going on right now, keyed by message id
+        self.sessions = {}
+        # sessions that opted out of being kept still need their auth for the buttons, until the token runs out
+        self.unlinked_entries = {}
+
+        if client.is_ready():
+            client.add_view(ResearchView(client))
+
+    @property
+    def emojis(self):
+        return self.client.config["emojis"]
+
+    @ext.Cog.listener()
+    async def on_ready(self):
+        self.client.add_view(ResearchView(self.client))
+
+    # the auth entry a research message's buttons should use, None once that session has ended
+    async def view_entry(self, message_id, state):
+        entry = self.client.linked_auth.get(state["author"], {}).get(state["account_id"])
+        # another cluster updating the session drops the copy here, so check the shared one before calling it ended
+        if entry is None and state["author"] not in self.client.linked_auth:
+            if await stw.adopt_session(self.client, state["author"]) is not None:
+                entry = self.client.linked_auth[state["author"]].get(state["account_id"])
+        if entry is None:
+            entry = self.unlinked_entries.get(message_id)
+        if entry is None or entry["expiry"] < time.time():
+            return None
+        return entry
+
+    # the session behind a research message, None once its view state has gone
+    async def research_session(self, message):
+        session = self.sessions.get(message.id)
+        if session is None:
+            state = self.client.view_states.get(message.id)
+            if state is None:
+                return None
+            entry = await self.view_entry(message.id, state)
+            # another press could have started one while the entry was being looked up
+            session = self.sessions.get(message.id)
+            if session is None:
+                session = self.sessions[message.id] = ResearchSession(self.client, self, message, state, entry)
+        return session
+
     def check_for_research_points_item(self, query_json):
 
         # Yes you can use the itemGuid from the notifications response from the claimcollectedresources response
@@ -288,6 +503,40 @@ class Research(ext.Cog):
 
         return None
 
+    # guesses how many research points an account could claim right now from how its earlier claims went
+    # None means there isn't enough to go on so it should just be claimed
+    def predict_research_points(self, entry, points):
+        model = entry.get("research")
+        if model is None:
+            return None
+
+        elapsed = time.time() - model["claimed_at"]
+        if elapsed < self.client.config["research_claim_cooldown"]:
+            return 0
+
+        # nothing builds up at max, and if no points were spent since it is still at max
+        if model["at_max"]:
+            return 0 if points == model["points"] else None
+
+        if model["rate"] is None:
+            return None
+
+        return math.floor(model["rate"] * elapsed)
+
+    # kept on the auth session entry so it lasts as long as the session does
+    def update_research_model(self, entry, claimed, points):
+        now = time.time()
+        model = entry.get("research")
+        rate = None if model is None else model["rate"]
+
+        if model is not None and claimed:
+            observed_rate = claimed / max(now - model["claimed_at"], 1)
+            smoothing = self.client.config["research_rate_smoothing"]
+            rate = observed_rate if rate is None else smoothing * observed_rate + (1 - smoothing) * rate
+
+        # no notifications from the claim means the account was sitting at max
+        entry["research"] = {"claimed_at": now, "rate": rate, "at_max": claimed is None, "points": points}
+
     def check_for_research_guid_key(self, query_json):
 
         items = query_json['profileChanges'][0]['profile']['items']
@@ -301,8 +550,6 @@ class Research(ext.Cog):
         return None
 
     async def research_command(self, ctx, slash, authcode, auth_opt_out):
-        gren = self.client.colours["research_green"]
-
         auth_info = await stw.get_or_create_auth_session(self.client, ctx, "daily", authcode, slash, auth_opt_out, True)
         if not auth_info[0]:
             return
@@ -320,15 +567,49 @@ class Research(ext.Cog):
         if ainfo3 != "logged_in_processing" and auth_info[2] != []:
             final_embeds = auth_info[2]
 
-        current_research_statistics_request = await stw.profile_request(self.client, "query", auth_info[1])
-        json_response = await current_research_statistics_request.json()
-        current_levels = await research_query(ctx, self.client, auth_info, slash, final_embeds, json_response)
-        if current_levels is None:
+        accounts = await stw.session_accounts(self.client, ctx, auth_info, authcode)
+        results = await stw.bounded_gather([self.claim_research(ctx, entry) for entry in accounts],
+                                           self.client.config["linked_account_concurrency"])
+        final_embeds += await stw.label_account_embeds(accounts, [embed for embed, view_state in results])
+
+        # the buttons can only spend points for one account, so they only show up when there is just the one
+        view_state = results[0][1]
+        if len(accounts) > 1 or view_state is None:
+            await stw.slash_edit_original(auth_info[0], slash, final_embeds)
             return
 
+        total_points, current_levels, rp_token_guid = view_state
+        research_view = ResearchView(self.client)
+        research_view.stop()
+        message = await stw.slash_edit_original(auth_info[0], slash, final_embeds, view=research_view)
+
+        entry = auth_info[1]
+        self.client.view_states.put(message.id, "research", author=ctx.author.id, account_id=entry["account_id"],
+                                    account_name=entry["account_name"], token_guid=rp_token_guid,
+                                    levels=current_levels, points=total_points['quantity'], rvn=None, last_cost=None,
+                                    amount=1, note="")
+        if entry not in self.client.linked_auth.get(ctx.author.id, {}).values():
+            now = time.time()
+            self.unlinked_entries = {message_id: unlinked for message_id, unlinked in self.unlinked_entries.items()
+                                     if unlinked["expiry"] > now}
+            self.unlinked_entries[message.id] = entry
+
+    # claims research points for one account, returns the embed and what the research buttons need if it worked
+    # query_json can be a campaign profile someone else already fetched for this account
+    async def claim_research(self, ctx, entry, query_json=None):
+        gren = self.client.colours["research_green"]
+
+        json_response = query_json
+        if json_response is None:
+            current_research_statistics_request = await stw.profile_request(self.client, "query", entry)
+            json_response = await current_research_statistics_request.json()
+        current_levels, embed = await research_query(ctx, self.client, entry, json_response)
+        if current_levels is None:
+            return embed, None
+
         # assign variables for error embeds
         support_url = self.client.config["support_url"]
-        acc_name = auth_info[1]["account_name"]
+        acc_name = entry["account_name"]
 
         # Find research guid to post too required for ClaimCollectedResources json
         research_guid_check = await asyncio.gather(asyncio.to_thread(self.check_for_research_guid_key, json_response))
@@ -337,24 +618,27 @@ class Research(ext.Cog):
             print("errors.stwdaily.failed_guid_research encountered:", json_response)
             error_code = "errors.stwdaily.failed_guid_research"
             embed = await stw.post_error_possibilities(ctx, self.client, "research", acc_name, error_code, support_url)
-            final_embeds.append(embed)
-            await stw.slash_edit_original(auth_info[0], slash, final_embeds)
-            return
+            return embed, None
 
         research_guid = research_guid_check[0]
         pass
 
-        current_research_statistics_request = await stw.profile_request(self.client, "resources", auth_info[1],
-                                                                        json={"collectorsToClaim": [research_guid]})
-        json_response = await current_research_statistics_request.json()
+        # the query already has the points item, so when nothing can have built up since last time the claim is skipped
+        query_points = await asyncio.to_thread(self.check_for_research_points_item, json_response)
+        claim = query_points is None or self.predict_research_points(entry, query_points[0]['quantity']) != 0
 
-        try:
-            error_code = json_response["errorCode"]
-            embed = await stw.post_error_possibilities(ctx, self.client, "research", acc_name, error_code, support_url)
-            final_embeds.append(embed)
-            await stw.slash_edit_original(auth_info[0], slash, final_embeds)
-        except:
-            pass
+        if claim:
+            current_research_statistics_request = await stw.profile_request(self.client, "resources", entry,
+                                                                            json={"collectorsToClaim": [research_guid]})
+            json_response = await current_research_statistics_request.json()
+
+            try:
+                error_code = json_response["errorCode"]
+                embed = await stw.post_error_possibilities(ctx, self.client, "research", acc_name, error_code,
+                                                           support_url)
+                return embed, None
+            except:
+                pass
 
         # Get total points
         total_points_check = await asyncio.gather(asyncio.to_thread(self.check_for_research_points_item, json_response))
@@ -362,9 +646,7 @@ class Research(ext.Cog):
             print("errors.stwdaily.failed_total_points encountered:", json_response)
             error_code = "errors.stwdaily.failed_total_points"
             embed = await stw.post_error_possibilities(ctx, self.client, "research", acc_name, error_code, support_url)
-            final_embeds.append(embed)
-            await stw.slash_edit_original(auth_info[0], slash, final_embeds)
-            return
+            return embed, None
 
         total_points, rp_token_guid = total_points_check[0][0], total_points_check[0][1]
 
@@ -372,42 +654,42 @@ class Research(ext.Cog):
         # you do not recieve notifications so this must be wrapped in a try statement
         # assume that research points generated is none since it is at max!
         research_points_claimed = None
-        try:
-            research_feedback, check = json_response["notifications"], False
-
-            for notification in research_feedback:
-                if notification["type"] == "collectedResourceResult":
-                    research_feedback, check = notification, True
-                    break
-
-            if not check:
-                error_code = "errors.stwdaily.failed_get_collected_resource_type"
-                embed = await stw.post_error_possibilities(ctx, self.client, "research", acc_name, error_code,
-                                                           support_url)
-                final_embeds.append(embed)
-                await stw.slash_edit_original(auth_info[0], slash, final_embeds)
-                return
+        if claim:
+            try:
+                research_feedback, check = json_response["notifications"], False
 
-            available_research_items, check = research_feedback["loot"]["items"], False
-            for research_item in available_research_items:
-                try:
-                    if research_item["itemType"] == self.item_templateid_research:
-                        research_item, check = research_item, True
+                for notification in research_feedback:
+                    if notification["type"] == "collectedResourceResult":
+                        research_feedback, check = notification, True
                         break
-                except:
-                    pass
 
-            if not check:
-                error_code = "errors.stwdaily.failed_get_collected_resource_item"
-                embed = await stw.post_error_possibilities(ctx, self.client, "research", acc_name, error_code,
-                                                           support_url)
-                final_embeds.append(embed)
-                await stw.slash_edit_original(auth_info[0], slash, final_embeds)
-                return
+                if not check:
+                    error_code = "errors.stwdaily.failed_get_collected_resource_type"
+                    embed = await stw.post_error_possibilities(ctx, self.client, "research", acc_name, error_code,
+                                                               support_url)
+                    return embed, None
+
+                available_research_items, check = research_feedback["loot"]["items"], False
+                for research_item in available_research_items:
+                    try:
+                        if research_item["itemType"] == self.item_templateid_research:
+                            research_item, check = research_item, True
+                            break
+                    except:
+                        pass
+
+                if not check:
+                    error_code = "errors.stwdaily.failed_get_collected_resource_item"
+                    embed = await stw.post_error_possibilities(ctx, self.client, "research", acc_name, error_code,
+                                                               support_url)
+                    return embed, None
+
+                research_points_claimed = research_item['quantity']
+            except:
+                pass
 
-            research_points_claimed = research_item['quantity']
-        except:
-            pass
+            self.update_research_model(entry, research_points_claimed, total_points['quantity'])
+            await stw.publish_session(self.client, ctx.author.id)
 
         # Create the embed for displaying nyaa~
 
@@ -416,6 +698,8 @@ class Research(ext.Cog):
                 claimed_text = f"*Claimed **{research_points_claimed}** research point*\n\u200b"
             else:
                 claimed_text = f"*Claimed **{research_points_claimed}** research points*\n\u200b"
+        elif not claim:
+            claimed_text = f"*No research points to claim yet*\n\u200b"
         else:
             claimed_text = f"*Did not claim any research points*\n\u200b"
         embed = discord.Embed(
@@ -429,39 +713,10 @@ class Research(ext.Cog):
         embed.add_field(name=f"\u200b", value=claimed_text)
         embed = await stw.set_thumbnail(self.client, embed, "research")
         embed = await stw.add_requested_footer(ctx, embed)
-
-        final_embeds.append(embed)
-        research_view = ResearchView(self.client, auth_info, ctx.author, total_points, current_levels, rp_token_guid,
-                                     ctx, slash)
-        research_view.message = await stw.slash_edit_original(auth_info[0], slash, final_embeds, view=research_view)
+        return embed, (total_points, current_levels, rp_token_guid)
 
     @ext.command(name='research',
-                 aliases=['rse', 'des', 'rgesearch', 'r4es', 'reas',
-                          'resd', 'resa', 're', 're4s', 'researtch', 're3search',
-                          'rexearch', 'resw', 'rfesearch', 'researhc', 'rea', 'rers',
-                          'reswarch', 'resdarch', 'resarch', 'redearch', 'researchh',
-                          'researfh', 'reseach', 'reseatrch', 'rsesearch', 'r3s', 'rews',
-                          'reseadrch', 'ers', 'rewearch', 'rese3arch', 'rssearch', 'gesearch',
-                          'esearch', 'resezrch', 're3s', 'reseearch', 'reasearch', 'rew', 'reds',
-                          'rses', 'researcyh', 'researdh', 'res4arch', 'ressearch', '5esearch', 'rezearch',
-                          'reseatch', 'researcfh', 'rrsearch', 'ees', 'researcgh', 'rseearch', 'reesarch', 'resaearch',
-                          'resear4ch', 'rds', 'rewsearch', 'tresearch', 'resefarch', 'reseaarch', 'researcxh', '4res', 'resx',
-                          'resesrch', 'resexarch', 'r4search', 'r4esearch', '4es', 'rresearch', 'resrearch', 'rs', 'resea4ch', 'fes',
-                          'gresearch', 'reseagch', 'es', 'r5es', 'rsearch', 'researvh', 'r3esearch', 'res4earch', 'researcjh', 'researech',
-                          'researchn', 'resesarch', 'researcy', 'researrch', 'resfearch', 'researcj', 'reseasrch', 'resear5ch', 'rez', 'r3es',
-                          'r3search', 'researc', 'res', 'researchj', 'refsearch', 'dres', 'rex', 'researchg', 'rrs', 'researchu', 'redsearch', 'rersearch',
-                          'reseafch', 'reesearch', 'researcvh', 'eesearch', 'resezarch', '5research', 'res3earch', 'resewarch', 'fesearch', 'reearch', 'resxearch',
-                          'rwes', 'rees', 'reswearch', 'reseaxrch', 'researcuh', 'refs', 'reseaqrch', 'resea4rch', 'rfs', 'fres', 'researgch', 'gres', 'reeearch',
-                          'resea5ch', 'rtes', 'resexrch', 'rws', 'tres', 'researchy', 'researcnh', 'rdesearch', 'researcch', 'rexs', 'rges', 'reserch',
-                          'resaerch', 'rese4arch', 'reserarch', 'researcu', 'researcbh', 'fresearch', 'rdes', 'rwesearch', 'rexsearch', 'desearch',
-                          'reseqarch', 'dresearch', 'rezsearch', 'researchb', 'reseaech', 'eresearch', 'researxch', 'researdch', 'r4s',
-                          'rfsearch', 'rres', 'reseagrch', 'reseaerch', 'ress', 'resaesaer', 'reseqrch', 'rfes', '4esearch',
-                          'rwsearch', 'resea5rch', 'rtesearch', 'researfch', '5res', 'researcdh', 'eres', 'ressarch',
-                          'resfarch', 'reseadch', 'rss', 'reszearch', 'reserach', 'reach', 'ersearch', 'reseazrch',
-                          'rdsearch', 'ges', 'researcn', 'researcg', '4research', 'researcb', 'ree', 'resz',
-                          'reseacrh', 'red', 'resdearch', 'reseawrch', '5es', 'rese', 'reseafrch', 'reaearch',
-                          'researh', 'tesearch', 'researxh', 'r5esearch', 'resrarch', 'researvch', 'res3arch',
-                          'resewrch', 'rezs', 're4search', 'tes', 'resedarch'],
+                 aliases=['res', 'rs'],
                  extras={'emoji': "research_point", "args": {
                      'authcode': 'The authcode to start an authentication session with if one does not exist, if an auth session already exists this argument is optional (Optional)',
                      'opt-out': 'Any value inputted into this field will opt you out of the authentication session system when you enter the authcode for this command (Optional)'}},
@@ -5,7 +5,6 @@ from discord.commands import (  # Importing the decorator that makes slash comma
     slash_command,
 )
 
-import items
 import stwutil as stw
 
 
@@ -34,8 +33,10 @@ class Reward(ext.Cog):
         except:
             pass
 
-        embed_colour = self.client.colours["reward_magenta"]
-        err_colour = self.client.colours["error_red"]
+        config = self.client.config
+        emoji = config.emoji
+        embed_colour = config.colour.reward_magenta
+        err_colour = config.colour.error_red
         if day == 'hi readers of the bot':
 
             embed = discord.Embed(colour=err_colour,
@@ -87,27 +88,28 @@ class Reward(ext.Cog):
                 return
 
             embed.add_field(name=f'**{reward[1]} Item: **', value=f'```{reward[0]}```\u200b')
-            for day1 in items.ItemDictionary:
-                if 'V-Bucks & X-Ray Tickets' in items.ItemDictionary[day1][0]:
-                    if int(day) % 336 < int(day1):
-                        if int(day1) - int(day) % 336 == 1:
-                            day_string = "day."
-                        else:
-                            day_string = "days."
-
-                        if vbucks is True:
-                            embed.add_field(
-                                name=f'**{self.client.config["emojis"]["vbucks"]}{self.client.config["emojis"]["xray"]} Next V-Bucks & X-Ray Tickets reward in: **',
-                                value=f'```{int(day1) - int(day) % 336} {day_string}```\u200b', inline=False)
-                        else:
-                            embed.add_field(
-                                name=f'**{self.client.config["emojis"]["xray"]} Next X-Ray Tickets reward in: **',
-                                value=f'```{int(day1) - int(day) % 336} {day_string}```\u200b', inline=False)
-                        break
+            reward_table = self.client.rewards
+            day_mod = int(day) % 336
+            for day1 in reward_table.vbucks_days:
+                if day_mod < day1:
+                    if day1 - day_mod == 1:
+                        day_string = "day."
+                    else:
+                        day_string = "days."
+
+                    if vbucks is True:
+                        embed.add_field(
+                            name=f'**{emoji.vbucks}{emoji.xray} Next V-Bucks & X-Ray Tickets reward in: **',
+                            value=f'```{day1 - day_mod} {day_string}```\u200b', inline=False)
+                    else:
+                        embed.add_field(
+                            name=f'**{emoji.xray} Next X-Ray Tickets reward in: **',
+                            value=f'```{day1 - day_mod} {day_string}```\u200b', inline=False)
+                    break
 
             rewards = ''
             for day2 in range(1, limit + 1):
-                rewards += stw.get_reward(self.client, day2 + int(day), vbucks)[0]
+                rewards += reward_table.get(day2 + int(day), vbucks)[0]
                 if not (day2 + 1 == limit + 1):
                     rewards += ', '
                 else:
@@ -119,7 +121,7 @@ class Reward(ext.Cog):
                                 inline=False)
             else:
                 embed.add_field(
-                    name=f'{self.client.config["emojis"]["calendar"]} Rewards for the next **{limit}** days:',
+                    name=f'{emoji.calendar} Rewards for the next **{limit}** days:',
                     value=f'```{rewards}```\u200b', inline=False)
 
             embed = await stw.set_thumbnail(self.client, embed, "stormbottle")
@@ -136,29 +138,7 @@ class Reward(ext.Cog):
                 await stw.slash_send_embed(ctx, slash, embed)
 
     @ext.command(name='reward',
-                 aliases=['reqward',
-                          'it4ms', 'i6tems',
-                          'geward', 'rewarrd', 'rewwrd',
-                          'rewared', 'feward', 'iteems', 'itfms',
-                          'iutems', 'reaard', 'ite4ms', 'litems', 'itrms',
-                          'itsms', 'rewardc', 'rewaard', 'rewa4d', 'r5eward', 'rewarr',
-                          'ittems', 'iytems', 'treward', 'deward', 'itemx', 'reard', 're2ward',
-                          'itemsx', 'rewafrd', 'reware', 'itemms', '4reward', 'rwrd', 'rewrerd', 'itemns',
-                          'rwward', 'rewa5rd', 'uitems', 'rfward', 'itejs', 'itemds', 'itens', 'resward', 'rgeward',
-                          'iftems', 'iotems', 'greward', 'teward', 'ereward', 'itemsa', 'itemsd', 'itemws', 'rewa4rd',
-                          'erward', 'rewar', 'rew3ard', 'rewawrd', 'rewatrd', 'irtems', 'oitems', 'ltems', 'itenms', 'rewar5d',
-                          'rewsard', 'iitems', '9items', 'itdems', 'itedms', 'resard', 'itsems', 'rewardx', 'rerward', 'jitems', 'itemzs',
-                          'rewqard', 'eeward', 'iems', 'ktems', 'itwems', 'rewar4d', 'rewarde', 'rewrad', 'it5ems', 'rewadr', 'otems', 'tems',
-                          'itemsw', 'r3eward', 'rrward', 'refward', 'itemz', 'rew2ard', 'itemes', 'itemd', 'rewagd', 'rewaqrd', 'rewazrd', 'igems',
-                          'rewafd', 'itesm', 'itemas', 'itemjs', 're4ward', 'rewrd', 'itemw', 're3ward', 'reqard', 'rward', 'ietms', '5reward', 'rewsrd',
-                          'rreward', 'dreward', 'rweward', 'reaward', 'itwms', 'rewadd', 'itms', 'rewward', 'rdeward', 'reawrd', 'itgems', 'ifems', 'it3ems',
-                          'freward', 'itemse', 'rweard', '4eward', 'rewaxrd', 'rewars', 'rewadrd', 'iteme', 'itema', 'rewardd', 'rewdard', 'itemsz', 'rewarsd',
-                          'reweard', 'ihtems', 'rewzard', 'itekms', 'item', 'itemxs', '8items', 'eward', 'rewa5d', 'iterms', 'rewarc', 'tiems', 'iktems', 're3ard',
-                          'itfems', 'rfeward', 'utems', 'rewxrd', 'rewzrd', 'ijtems', 'rsward', 'r3ward', 'r4eward', 'ites', 'rewarfd', '9tems', 'rewards', 'rseward',
-                          'jtems', 'rewardf', 'itemks', 'i5tems', 'ite3ms', 'reeward', 'rewasrd', 'rewargd', 'i9tems', 'rewartd', 'rewatd', 'items', 'redward', 'rewarcd',
-                          'rteward', 'kitems', 'itmes', 'it6ems', 'itesms', 'rewad', 'rewaerd', '8tems', 'itewms', 'reeard', 'ityems', 'rewxard', 'rdw', 'itdms', 'rewardr',
-                          'igtems', 'rewarxd', 'rdward', 're2ard', 'irems', 'i5ems', 'r4ward', 'iyems', 'iltems', 'ithems', '5eward', 'itrems', 'rewarf', 'redard', 'ihems',
-                          'i6ems', 'rewarx', 'i8tems', 'itefms', 'rwd', 'itejms', 'it4ems', 'itemss', 'iteks', 'it3ms', 'rewaed', 'rewqrd', 'rewagrd'],
+                 aliases=['rewards', 'items', 'item', 'rwd'],
                  extras={'emoji': "stormeye", "args": {'day': 'The day to view the reward for',
                                                        'limit': 'The amount of days after the specified days that rewards will be given for (Optional)'}},
                  brief="View daily rewards from a certain day for a certain amount of days after",
@@ -28,7 +28,7 @@ class Reminder(ext.Cog):
         # skuby was here
         embed = discord.Embed(title='Daily reminder:',
                               description=f'You can now claim today\'s daily reward. \n '
-                                          f'Next daily reminder <t:{int(datetime.datetime.combine(datetime.datetime.utcnow() + datetime.timedelta(days=1), datetime.datetime.min.time()).replace(tzinfo=datetime.timezone.utc).timestamp())}:R>.',
+                                          f'Next daily reminder <t:{stw.reset_clock.reset_timestamp()}:R>.',
                               colour=discord.Colour.blue())
         embed.add_field(name='Item shop:', value='[fnbr.co/shop](https://fnbr.co/shop)', inline=True)
         embed.add_field(name='\u200b', value='\u200b')
@@ -54,9 +54,12 @@ class TradingNag(ext.Cog):
 
     def __init__(self, client):
         self.client = client
-        self.emojis = client.config["emojis"]
         self.tradingnag.start()
 
+    @property
+    def emojis(self):
+        return self.client.config["emojis"]
+
     # simple task to send trading nag to stw dailies trading channel everyday
     @tasks.loop(time=datetime.time(7, 0, tzinfo=datetime.timezone.utc))
     async def tradingnag(self):
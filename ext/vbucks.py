@@ -12,25 +12,23 @@ class Vbucks(ext.Cog):
 
     def __init__(self, client):
         self.client = client
-        self.emojis = client.config["emojis"]
 
-    async def check_errors(self, ctx, public_json_response, auth_info, final_embeds, slash):
+    @property
+    def emojis(self):
+        return self.client.config["emojis"]
+
+    async def check_errors(self, ctx, public_json_response, entry):
         try:
             # general error
             error_code = public_json_response["errorCode"]
             support_url = self.client.config["support_url"]
-            acc_name = auth_info[1]["account_name"]
-            embed = await stw.post_error_possibilities(ctx, self.client, "vbucks", acc_name, error_code, support_url)
-            final_embeds.append(embed)
-            await stw.slash_edit_original(auth_info[0], slash, final_embeds)
-            return True
+            acc_name = entry["account_name"]
+            return await stw.post_error_possibilities(ctx, self.client, "vbucks", acc_name, error_code, support_url)
         except:
             # no error
-            return False
+            return None
 
     async def vbuck_command(self, ctx, slash, authcode, auth_opt_out):
-        vbucc_colour = self.client.colours["vbuck_blue"]
-
         auth_info = await stw.get_or_create_auth_session(self.client, ctx, "vbucks", authcode, slash, auth_opt_out,
                                                          True)
         if not auth_info[0]:
@@ -49,52 +47,50 @@ class Vbucks(ext.Cog):
         if ainfo3 != "logged_in_processing" and auth_info[2] != []:
             final_embeds = auth_info[2]
 
-        # get common core profile
-        core_request = await stw.profile_request(self.client, "query", auth_info[1], profile_id="common_core")
-        core_json_response = await core_request.json()
-        # ROOT.profileChanges[0].profile.stats.attributes.homebase_name
-
-        # check for le error code
-        if await self.check_errors(ctx, core_json_response, auth_info, final_embeds, slash):
-            return
+        accounts = await stw.session_accounts(self.client, ctx, auth_info, authcode)
+        embeds = await stw.bounded_gather([self.vbucks_embed(ctx, entry) for entry in accounts],
+                                          self.client.config["linked_account_concurrency"])
+        final_embeds += await stw.label_account_embeds(accounts, embeds)
+        await stw.slash_edit_original(auth_info[0], slash, final_embeds)
+        return
 
-        vbucks = await asyncio.gather(asyncio.to_thread(stw.extract_item, profile_json=await core_request.json(),
-                                                        item_string="Currency:Mtx"))
+    async def vbucks_embed(self, ctx, entry):
+        vbucc_colour = self.client.colours["vbuck_blue"]
 
-        # fetch x-ray ticket count
-        stw_request = await stw.profile_request(self.client, "query", auth_info[1], profile_id="stw")
-        stw_json_response = await stw_request.json()
+        # both profiles are independent so ask for them at the same time
+        core_request, stw_request = await asyncio.gather(
+            stw.profile_request(self.client, "query", entry, profile_id="common_core"),
+            stw.profile_request(self.client, "query", entry, profile_id="stw"))
+        core_json_response, stw_json_response = await asyncio.gather(core_request.json(), stw_request.json())
+        # ROOT.profileChanges[0].profile.stats.attributes.homebase_name
 
         # check for le error code
-        error_check = await self.check_errors(ctx, stw_json_response, auth_info, final_embeds, slash)
-        if error_check:
-            return
+        error_embed = await self.check_errors(ctx, core_json_response, entry)
+        if error_embed is None:
+            error_embed = await self.check_errors(ctx, stw_json_response, entry)
+        if error_embed is not None:
+            return error_embed
 
-        xray = await asyncio.gather(asyncio.to_thread(stw.extract_item, profile_json=await stw_request.json(),
-                                                      item_string="AccountResource:currency_xrayllama"))
-
-        # fetch vbucks total
-        vbucks_total = await stw.calculate_vbucks(vbucks)
+        # total, per source breakdown and x-ray tickets all in one pass
+        vbucks_total, vbuck_sources, xray = await asyncio.to_thread(stw.aggregate_currency, core_json_response,
+                                                                    stw_json_response)
 
         # With all info extracted, create the output
         embed = discord.Embed(title=await stw.add_emoji_title(self.client, "V-Bucks", "vbuck_book"),
                               description=f"\u200b\n**Total V-Bucks: {vbucks_total}**\u200b\n",
                               colour=vbucc_colour)
 
-        # add entry for each platform detected
+        # add entry for each source detected
         if vbucks_total != 0:
-            for item in vbucks:
-                for attr, val in item.items():
-                    name, emoji = await stw.resolve_vbuck_source(val["templateId"])
-                    embed.description += f"""{self.emojis[emoji]} {name}: {val["quantity"]}\n"""
+            for template_id, quantity in vbuck_sources.items():
+                name, emoji = await stw.resolve_vbuck_source(template_id)
+                embed.description += f"""{self.emojis[emoji]} {name}: {quantity}\n"""
         else:
             embed.description += f"""{self.emojis["spongebob"]} No V-Bucks? {self.emojis["megamind"]}\n"""
 
         # add entry for x-ray if detected
-        if xray:
-            for item in xray:
-                for attr, val in item.items():
-                    embed.description += f"""\u200b\n{self.emojis["xray"]} X-Ray Tickets: {val["quantity"]}\n"""
+        if xray is not None:
+            embed.description += f"""\u200b\n{self.emojis["xray"]} X-Ray Tickets: {xray}\n"""
 
         embed.description += "\u200b"
 
@@ -103,9 +99,7 @@ class Vbucks(ext.Cog):
         else:
             embed = await stw.set_thumbnail(self.client, embed, "clown")
         embed = await stw.add_requested_footer(ctx, embed)
-        final_embeds.append(embed)
-        await stw.slash_edit_original(auth_info[0], slash, final_embeds)
-        return
+        return embed
 
     @ext.slash_command(name='vbucks',
                        description='Lets you view your V-Bucks balance',
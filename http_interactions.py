@@ -0,0 +1,101 @@
+# Serves slash commands, buttons and selects over discord's interactions endpoint instead of the gateway, so as many of
+# these as needed can sit behind a load balancer while the shards only look after mentions.
+import json
+import os
+import time
+
+import discord
+from aiohttp import web
+
+import stwutil as stw
+
+# PyNaCl is only needed to check discord's signatures in this mode
+try:
+    from nacl.exceptions import BadSignatureError
+    from nacl.signing import VerifyKey
+except ImportError:
+    BadSignatureError = VerifyKey = None
+
+
+class InteractionServer:
+
+    def __init__(self, client):
+        self.client = client
+        self.verify_key = None
+        self.runner = None
+
+    async def start(self, token):
+        if VerifyKey is None:
+            raise RuntimeError("PyNaCl is needed to serve interactions over http, install it with: pip install pynacl")
+
+        await self.client.login(token)
+        app_info = await self.client.application_info()
+        # the gateway's ready event is what normally tells the client its application id
+        self.client._connection.application_id = app_info.id
+        self.verify_key = VerifyKey(bytes.fromhex(app_info.verify_key))
+        await stw.sync_commands(self.client, self.client.config["command_sync_path"], self.client.startup)
+
+        # nothing ever connects to the gateway, so this is as ready as the bot gets
+        self.client._handle_ready()
+        self.client.dispatch("ready")
+
+        app = web.Application()
+        app.router.add_post(self.client.config["interactions_path"], self.handle)
+        self.runner = web.AppRunner(app)
+        await self.runner.setup()
+
+        # hosts like heroku say which port to use
+        port = int(os.environ.get("PORT", self.client.config["interactions_port"]))
+        await web.TCPSite(self.runner, self.client.config["interactions_host"], port).start()
+        print(f"Serving interactions on port {port}")
+
+    async def close(self):
+        if self.runner is not None:
+            await self.runner.cleanup()
+        await self.client.close()
+
+    def verify(self, request, body):
+        try:
+            timestamp = request.headers["X-Signature-Timestamp"]
+            # the signature stays valid forever, the timestamp it covers is what stops a captured request being replayed
+            if abs(time.time() - int(timestamp)) > self.client.config["interactions_max_age"]:
+                return False
+
+            signature = bytes.fromhex(request.headers["X-Signature-Ed25519"])
+            self.verify_key.verify(timestamp.encode() + body, signature)
+            return True
+        except (KeyError, ValueError, BadSignatureError):
+            return False
+
+    async def handle(self, request):
+        body = await request.read()
+        if not self.verify(request, body):
+            return web.Response(status=401, text="invalid request signature")
+
+        data = json.loads(body)
+
+        # discord making sure the endpoint is ours
+        if data["type"] == 1:
+            return web.json_response({"type": 1})
+        if data["type"] not in (2, 3):
+            return web.Response(status=400)
+
+        # commands get "thinking..." and buttons nothing visible, whatever the command sends fills it in later, the
+        # answer goes out before any of that starts so discord never sees an edit for a response it doesn't have yet
+        response = web.json_response({"type": 5 if data["type"] == 2 else 6})
+        await response.prepare(request)
+        await response.write_eof()
+
+        self.dispatch(data)
+        return response
+
+    # the same as an interaction arriving over the gateway, only already answered
+    def dispatch(self, data):
+        state = self.client._connection
+        interaction = discord.Interaction(data=data, state=state)
+        interaction.response._responded = True
+        stw.record_ack(self.client, interaction)
+
+        if data["type"] == 3:
+            state._view_store.dispatch(interaction.data["component_type"], interaction.data["custom_id"], interaction)
+        self.client.dispatch("interaction", interaction)
@@ -0,0 +1,222 @@
+# Compiles config.toml into a read-only snapshot for STW daily, with the lookups the commands keep doing worked out once.
+# The parsed config is cached next to the toml keyed by its hash, so startup only parses the toml after it changes.
+# lang.toml and the item data are snapshotted alongside it, and all three are swapped in together when they're edited.
+import asyncio
+import contextvars
+import hashlib
+import os
+import pickle
+import runpy
+import types
+
+import discord
+
+# Compatability layer for future versions of python 3.11+
+try:
+    import tomllib as toml
+except ModuleNotFoundError:
+    import tomli as toml
+
+# the files a snapshot is made from
+data_paths = {"config": "config.toml", "lang": "lang.toml", "items": "items.py"}
+
+# tables nothing in the bot reads, they stay in the toml for reference but are left out of the snapshot
+unused_sections = ("bannercolours",)
+
+
+def freeze(value):
+    if isinstance(value, dict):
+        return types.MappingProxyType({key: freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(freeze(item) for item in value)
+    return value
+
+
+# reads like the dict the toml parses into (config["emojis"]["error"] etc.) but can't be changed, so a command can
+# hold onto it for as long as it runs. the emojis and colours are attributes too (config.emoji.error), one attribute
+# lookup each for the commands that build a lot of text out of them
+class CompiledConfig:
+
+    def __init__(self, raw, digest):
+        self.digest = digest
+        self.settings = freeze(raw)
+
+        self.colours = types.MappingProxyType({name: discord.Colour.from_rgb(*colour)
+                                               for name, colour in raw["colours"].items()})
+        self.emoji = types.SimpleNamespace(**raw["emojis"])
+        self.colour = types.SimpleNamespace(**self.colours)
+        self.known_auth_codes = frozenset(raw["known_auth_codes"])
+
+        # every operation and profile already filled into the profile url, only the account id is left to format in
+        profile = raw["endpoints"]["profile"]
+        self.profile_urls = types.MappingProxyType({
+            (req_type, profile_id): profile.format("{}", operation, profile_name)
+            for req_type, operation in raw["profile"].items()
+            for profile_id, profile_name in raw["profileid"].items()
+        })
+
+    def __getitem__(self, key):
+        return self.settings[key]
+
+    def __contains__(self, key):
+        return key in self.settings
+
+    def get(self, key, default=None):
+        return self.settings.get(key, default)
+
+
+def parse(data):
+    raw = toml.loads(data.decode("utf-8"))
+    for section in unused_sections:
+        raw.pop(section, None)
+    return raw
+
+
+# the digest goes on the first line, ahead of the pickle, so a cache that doesn't match is never unpickled
+def write_cache(cache_path, digest, raw):
+    try:
+        temp_path = f"{cache_path}.tmp"
+        with open(temp_path, "wb") as cache_file:
+            cache_file.write(digest.encode() + b"\n")
+            pickle.dump(raw, cache_file, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temp_path, cache_path)
+    except OSError:
+        pass
+
+
+# the parsed toml and its hash, straight from the cache when the toml hasn't changed since it was last parsed
+def load_toml(toml_path):
+    with open(toml_path, "rb") as toml_file:
+        data = toml_file.read()
+    digest = hashlib.sha256(data).hexdigest()
+    cache_path = f"{toml_path}.cache"
+
+    try:
+        with open(cache_path, "rb") as cache_file:
+            if cache_file.readline().rstrip(b"\n") == digest.encode():
+                return pickle.load(cache_file), digest
+    except (OSError, EOFError, pickle.UnpicklingError):
+        pass
+
+    raw = parse(data)
+    write_cache(cache_path, digest, raw)
+    return raw, digest
+
+
+def load(config_path):
+    return CompiledConfig(*load_toml(config_path))
+
+
+def load_lang(lang_path):
+    raw = load_toml(lang_path)[0]
+    if not isinstance(raw.get("en"), dict):
+        raise ValueError(f"{lang_path} has no [en] table")
+    return freeze(raw)
+
+
+def load_items(items_path):
+    item_dictionary = runpy.run_path(items_path)["ItemDictionary"]
+    for day, item in item_dictionary.items():
+        if not day.isdigit() or len(item) < 2 or not all(isinstance(part, str) for part in item):
+            raise ValueError(f"{items_path} has a broken entry for day {day}")
+    return freeze(item_dictionary)
+
+
+# everything the commands read from the data files at one point in time
+class DataSnapshot:
+
+    def __init__(self, version, config, lang, items):
+        self.version = version
+        self.config = config
+        self.lang = lang
+        self.items = items
+        self.rewards = RewardTable(config, items)
+
+
+# every day's reward with its emojis already put together, with and without v-bucks, so the reward and daily commands
+# can list a hundred days without looking up a single emoji
+class RewardTable:
+
+    cycle = 336
+
+    def __init__(self, config, items):
+        emojis = config["emojis"]
+        self.rewards = {}
+        for day, item in items.items():
+            name, item_emojis = item[0], list(item[1:])
+            self.rewards[(int(day), True)] = (name, "".join(emojis[emoji] for emoji in item_emojis))
+
+            if "vbucks" in item_emojis:
+                item_emojis.remove("vbucks")
+            self.rewards[(int(day), False)] = (name.replace("V-Bucks & ", ""),
+                                               "".join(emojis[emoji] for emoji in item_emojis))
+
+        self.vbucks_days = tuple(sorted(int(day) for day, item in items.items() if "V-Bucks & X-Ray Tickets" in item[0]))
+
+    def get(self, day, vbucks=True):
+        day_mod = int(day) % self.cycle
+        if day_mod == 0:
+            day_mod = self.cycle
+        return self.rewards[(day_mod, bool(vbucks))]
+
+
+# builds the next snapshot and makes sure the files still fit together, raises instead of returning half of one
+def load_snapshot(version, paths=data_paths, running=None):
+    config, lang, items = load(paths["config"]), load_lang(paths["lang"]), load_items(paths["items"])
+
+    # a setting going missing would only show up once a command tried to use it
+    if running is not None:
+        missing = [key for key in running.config.settings if key not in config]
+        if missing:
+            raise ValueError(f"{paths['config']} is missing {', '.join(missing)}")
+
+    emojis = config["emojis"]
+    missing = sorted({emoji for item in items.values() for emoji in item[1:] if emoji not in emojis})
+    if missing:
+        raise ValueError(f"{paths['items']} uses emojis that aren't in {paths['config']}: {', '.join(missing)}")
+
+    return DataSnapshot(version, config, lang, items)
+
+
+# the snapshot a command started with, set for the task running it and every task that task starts
+pinned_snapshot = contextvars.ContextVar("pinned_snapshot", default=None)
+
+
+# holds the current snapshot and swaps in a new one when the data files change, a command pins whichever one was current
+# when it started so a reload halfway through can't change the settings it's using
+class SnapshotStore:
+
+    def __init__(self, paths=data_paths):
+        self.paths = paths
+        self.stamps = self.file_stamps()
+        self.current = load_snapshot(1, paths)
+
+    def file_stamps(self):
+        stamps = {}
+        for name, path in self.paths.items():
+            try:
+                stat = os.stat(path)
+                stamps[name] = (stat.st_mtime_ns, stat.st_size)
+            except OSError:
+                stamps[name] = None
+        return stamps
+
+    def active(self):
+        return pinned_snapshot.get() or self.current
+
+    def pin(self):
+        pinned_snapshot.set(self.current)
+
+    # returns what changed, raises if the new files don't load and keeps serving the old snapshot
+    async def reload(self, force=False):
+        stamps = self.file_stamps()
+        changed = [name for name in stamps if stamps[name] != self.stamps.get(name)]
+        if not changed and not force:
+            return []
+
+        # a broken edit is only tried again once the file is saved again
+        self.stamps = stamps
+        snapshot = await asyncio.to_thread(load_snapshot, self.current.version + 1, self.paths, self.current)
+
+        self.current = snapshot
+        return changed or list(stamps)
@@ -1,24 +1,51 @@
 # Utility library for STW daily.
 import asyncio
 import datetime
+import hashlib
+import importlib
+import json
+import os
 import random
 import re
 import time
 import math
+import types
+from concurrent.futures import ThreadPoolExecutor
 
 import discord
+import discord.ext.commands as ext
 
-import items
 
 guild_ids = None
 
 
-def process_quotes_in_message(message):
-    # do not question the ways of the regex
-    re_iter = re.finditer(r'((?:(?:^|\s)\")|(?:\"(?:\s|$)))', message.content)
+# finds the quotes the old regex ((^|\s)") | ("(\s|$)) would have matched by only looking at the quotes themselves,
+# gives back (index, closing) where a quote opened after whitespace is reported at the whitespace like the regex did
+def tokenise_quotes(content):
+    boundaries = []
+    length = len(content)
+    consumed = 0
+
+    index = content.find('"')
+    while index != -1:
+        if index == 0:
+            boundaries.append((0, True))
+            consumed = 1
+        elif index - 1 >= consumed and content[index - 1].isspace():
+            boundaries.append((index - 1, False))
+            consumed = index + 1
+        elif index + 1 == length or content[index + 1].isspace():
+            boundaries.append((index, True))
+            consumed = index + 2
+
+        index = content.find('"', index + 1)
+
+    return boundaries
 
-    indices = [m.start(0) for m in re_iter]
-    content = list(message.content)
+
+def escape_quotes(content):
+    boundaries = tokenise_quotes(content)
+    indices = [index for index, closing in boundaries]
 
     if len(indices) == 1:
         indices = []
@@ -28,7 +55,7 @@ def process_quotes_in_message(message):
         rem_values = []
 
         # true represents an ending ", False represents a starting "
-        temp_indices = [True if content[index] == '"' else False for index in indices]
+        temp_indices = [closing for index, closing in boundaries]
 
         for index, value in enumerate(temp_indices[:-1]):
 
@@ -43,15 +70,149 @@ def process_quotes_in_message(message):
         for remove_index in rem_values:
             indices[remove_index] = 0
 
-    # fear my list comprehension
-    escaped_content = [r'\\"' if char == '"' and index not in indices else char for index, char in enumerate(content)]
+    # only the quotes that were kept need looking at, everything between them gets escaped in one go
+    kept = sorted({index for index in indices if content[index] == '"'})
+
+    escaped_content = []
+    last = 0
+    for index in kept:
+        escaped_content.append(content[last:index].replace('"', r'\\"'))
+        last = index + 1
+
+    escaped_content.append(content[last:].replace('"', r'\\"'))
+    return '"'.join(escaped_content)
 
-    # reform list into a string
-    message.content = "".join(escaped_content)
 
+def process_quotes_in_message(message):
+    message.content = escape_quotes(message.content)
     return message
 
 
+# how long each part of starting up took, kept on the client for the info command
+class StartupProfile:
+
+    def __init__(self, started):
+        self.started = started
+        self.imports = {}
+        self.setups = {}
+        self.sync = None
+        self.ready = None
+
+    def mark_ready(self):
+        if self.ready is None:
+            self.ready = time.perf_counter() - self.started
+
+    def summary(self):
+        slowest = max(self.imports, key=self.imports.get)
+        ready = "not yet" if self.ready is None else f"{self.ready:.1f}s"
+        if self.sync is None:
+            sync = "not yet"
+        elif self.sync is False:
+            sync = "skipped, unchanged"
+        else:
+            sync = f"{self.sync * 1000:.0f}ms"
+        # the extensions import at the same time, so the imports add up to more than the time they took
+        return (f"Imports: {sum(self.imports.values()) * 1000:.0f}ms "
+                f"(slowest {slowest} {self.imports[slowest] * 1000:.0f}ms)\n"
+                f"Cog setup: {sum(self.setups.values()) * 1000:.0f}ms\n"
+                f"Command sync: {sync}\n"
+                f"Ready after: {ready}")
+
+
+# the extension modules are imported side by side first so whatever they pull in (psutil for info etc.) loads at the
+# same time, load_extension then runs each module and its setup with everything already imported
+def load_extensions(client, extensions, profile):
+    def timed_import(name):
+        started = time.perf_counter()
+        importlib.import_module(name)
+        return time.perf_counter() - started
+
+    names = [f"ext.{extension}" for extension in extensions]
+    with ThreadPoolExecutor(max_workers=len(names)) as pool:
+        for name, import_time in zip(names, pool.map(timed_import, names)):
+            profile.imports[name] = import_time
+
+    for name in names:
+        started = time.perf_counter()
+        client.load_extension(name)
+        profile.setups[name] = time.perf_counter() - started
+
+
+# extensions that wait until one of their commands is used for the first time, gives back whether one got loaded
+def load_deferred(client, command_name):
+    extension = client.deferred_commands.get(command_name.lower())
+    if extension is None:
+        return False
+
+    for name in [name for name, owner in client.deferred_commands.items() if owner == extension]:
+        del client.deferred_commands[name]
+
+    started = time.perf_counter()
+    client.load_extension(f"ext.{extension}")
+    client.startup.setups[f"ext.{extension}"] = time.perf_counter() - started
+    return True
+
+
+# the slash commands exactly as they'd be sent to discord, along with the bot and the guilds they go to
+def command_payload_hash(client):
+    payload = sorted(json.dumps({"command": command.to_dict(), "guild_ids": command.guild_ids}, sort_keys=True)
+                     for command in client.pending_application_commands)
+    return hashlib.sha256("\n".join([str(client.user.id)] + payload).encode()).hexdigest()
+
+
+# py-cord would compare every command with discord on every connect, instead the commands are only synced when they
+# changed since the last sync, otherwise the ids discord gave them last time are all that's needed to run them
+# (delete the sync file to sync anyway, e.g. after changing the commands in the developer portal)
+async def sync_commands(client, path, profile):
+    digest = command_payload_hash(client)
+    try:
+        with open(path, encoding="utf-8") as sync_file:
+            synced = json.load(sync_file)
+    except (OSError, ValueError):
+        synced = {}
+
+    if synced.get("digest") == digest:
+        for registered in synced["commands"]:
+            command = discord.utils.get(client.pending_application_commands, name=registered["name"],
+                                        type=registered["type"])
+            if command is not None:
+                command.id = registered["id"]
+                client._application_commands[command.id] = command
+        if profile.sync is None:
+            profile.sync = False
+        return False
+
+    started = time.perf_counter()
+    await client.sync_commands()
+    profile.sync = time.perf_counter() - started
+
+    # a command in several guilds has an id in each of them
+    commands = [{"id": command_id, "name": command.name, "type": command.type}
+                for command_id, command in client._application_commands.items()]
+    temp_path = f"{path}.tmp"
+    with open(temp_path, "w", encoding="utf-8") as sync_file:
+        json.dump({"digest": digest, "commands": commands}, sync_file)
+    os.replace(temp_path, path)
+    return True
+
+
+# uvloop gets through the networking the bot spends nearly all its time on quicker than asyncio's own loop, it's
+# optional (and not on windows) so "auto" just uses it when it's installed
+def install_event_loop_policy(choice):
+    if choice == "asyncio":
+        return "asyncio"
+
+    try:
+        import uvloop
+    except ImportError:
+        if choice == "uvloop":
+            print("uvloop was picked as the event loop but isn't installed, using asyncio instead")
+        return "asyncio"
+
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return "uvloop"
+
+
 # a small bridge helper function between slash commands and normal commands
 async def slash_send_embed(ctx, slash, embeds, view=None):
     try:
@@ -60,17 +221,261 @@ async def slash_send_embed(ctx, slash, embeds, view=None):
         embeds = [embeds]
 
     if slash:
+        changes = {"embeds": embeds}
         if view is not None:
-            return await ctx.respond(embeds=embeds, view=view)
-        else:
-            return await ctx.respond(embeds=embeds)
+            changes["view"] = view
+
+        # the deferred response gets filled in, from then on it is the original response just like a normal reply
+        if getattr(ctx, "deferred_response", False):
+            ctx.deferred_response = False
+            await edit_original(ctx.interaction, **changes)
+            return ctx.interaction
+        return await ctx.respond(**changes)
     else:
         if view is not None:
-            return await ctx.send(embeds=embeds, view=view)
+            message = await ctx.send(embeds=embeds, view=view)
+            # unlike edits, send tracks the view against the message even when it's stopped, and never lets go of it
+            if view.is_finished():
+                message._state.prevent_view_updates_for(message.id)
+            return message
         else:
             return await ctx.send(embeds=embeds)
 
 
+# slash commands get acknowledged the moment they're invoked so slow auth or epic can't run out discord's 3 seconds,
+# whatever the command sends first then fills in the deferred response
+async def defer_interaction(client, ctx):
+    if not isinstance(ctx, discord.ApplicationContext):
+        return
+
+    # over http the deferred response went back as the answer to discord's request already
+    if client.http_interactions:
+        ctx.deferred_response = True
+        return
+
+    if ctx.interaction.response.is_done():
+        return
+
+    await ctx.defer()
+    ctx.deferred_response = True
+    record_ack(client, ctx.interaction)
+
+
+# measured from when discord created the interaction, so time spent before it got to us counts too
+def record_ack(client, interaction):
+    created = discord.utils.snowflake_time(interaction.id)
+    client.ack_times.append((discord.utils.utcnow() - created).total_seconds() * 1000)
+
+
+# what a button or select does to its message, over http the press was acknowledged already so the message is
+# edited through the interaction instead
+async def update_interaction_message(interaction, **kwargs):
+    if interaction.response.is_done():
+        return await edit_original(interaction, **kwargs)
+    return await interaction.response.edit_message(**kwargs)
+
+
+async def send_ephemeral(interaction, **kwargs):
+    if interaction.response.is_done():
+        return await interaction.followup.send(ephemeral=True, **kwargs)
+    return await interaction.response.send_message(ephemeral=True, **kwargs)
+
+
+# average and 99th percentile of the recorded times to first ack in ms, None until there is one
+def ack_stats(ack_times):
+    if not ack_times:
+        return None
+
+    times = sorted(ack_times)
+    return sum(times) / len(times), times[math.ceil(len(times) * 0.99) - 1]
+
+
+# when cluster.py runs the bot as several processes each one keeps a connection to it, guild counts go up and the
+# total over every cluster comes back, reloads done in one cluster are passed on to the rest
+class ClusterLink:
+
+    def __init__(self, client, cluster_id, port, secret):
+        self.client = client
+        self.cluster_id = cluster_id
+        self.port = port
+        self.secret = secret
+        self.writer = None
+        self.guild_total = None
+        self.request_id = 0
+        self.requests = {}
+
+    async def connect(self):
+        reader, self.writer = await asyncio.open_connection("127.0.0.1", self.port)
+        asyncio.get_event_loop().create_task(self.listen(reader))
+        await self.send("hello", secret=self.secret)
+
+    async def send(self, op, **data):
+        if self.writer is None:
+            return
+
+        data["op"] = op
+        data["cluster"] = self.cluster_id
+        self.writer.write(json.dumps(data).encode() + b"\n")
+        await self.writer.drain()
+
+    # an op the launcher answers, without a launcher to ask the answer is None
+    async def request(self, op, **data):
+        if self.writer is None:
+            return None
+
+        self.request_id += 1
+        future = asyncio.get_event_loop().create_future()
+        self.requests[self.request_id] = future
+        await self.send(op, id=self.request_id, **data)
+        return await future
+
+    async def listen(self, reader):
+        while line := await reader.readline():
+            message = json.loads(line)
+            if message["op"] == "reply":
+                future = self.requests.pop(message["id"], None)
+                if future is not None and not future.done():
+                    future.set_result(message["value"])
+            elif message["op"] == "invalidate":
+                forget_cached(self.client, message["key"])
+            elif message["op"] == "guilds":
+                self.guild_total = message["total"]
+            elif message["op"] in ("reload", "load"):
+                try:
+                    getattr(self.client, f"{message['op']}_extension")(f"ext.{message['extension']}")
+                except Exception as e:
+                    print(f"Failed to {message['op']} cog {message['extension']} from another cluster: {e}")
+
+        # the launcher is gone, it starts a fresh set of clusters when it comes back
+        self.writer = None
+        for future in self.requests.values():
+            if not future.done():
+                future.set_result(None)
+        self.requests.clear()
+        await self.client.close()
+
+
+# values with their own expiry that every cluster can see, the launcher keeps the one all the clusters share and a
+# single process just keeps its own. get and set are one dict lookup each, expired keys go when they're next looked
+# at or when the dict has doubled in size since it was last swept
+class SharedCache:
+
+    def __init__(self):
+        self.entries = {}
+        self.hits = 0
+        self.misses = 0
+        self.sweep_at = 1024
+
+    def get(self, key):
+        item = self.entries.get(key)
+        if item is None or item[1] < time.time():
+            if item is not None:
+                del self.entries[key]
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return item[0]
+
+    def set(self, key, value, ttl):
+        self.entries[key] = (value, time.time() + ttl)
+        if len(self.entries) >= self.sweep_at:
+            self.sweep()
+
+    def delete(self, key):
+        self.entries.pop(key, None)
+
+    def sweep(self):
+        now = time.time()
+        for key in [key for key, item in self.entries.items() if item[1] < now]:
+            del self.entries[key]
+        self.sweep_at = max(1024, len(self.entries) * 2)
+
+    def stats(self):
+        return {"hits": self.hits, "misses": self.misses, "keys": len(self.entries)}
+
+
+async def cache_get(client, key):
+    if client.cluster is not None:
+        return await client.cluster.request("cache_get", key=key)
+    return client.shared_cache.get(key)
+
+
+# values have to be plain json so they can go between clusters
+async def cache_set(client, key, value, ttl):
+    if client.cluster is not None:
+        await client.cluster.send("cache_set", key=key, value=value, ttl=ttl)
+    else:
+        client.shared_cache.set(key, value, ttl)
+
+
+async def cache_delete(client, key):
+    if client.cluster is not None:
+        await client.cluster.send("cache_delete", key=key)
+    else:
+        client.shared_cache.delete(key)
+
+
+async def cache_stats(client):
+    if client.cluster is not None:
+        return await client.cluster.request("cache_stats")
+    return client.shared_cache.stats()
+
+
+# another cluster changed a key, whatever this one kept of it locally is out of date now
+def forget_cached(client, key):
+    kind, _, user_id = key.partition(":")
+    if kind == "session":
+        client.linked_auth.pop(int(user_id), None)
+        client.temp_auth.pop(int(user_id), None)
+
+
+# the linked accounts of a user go in the shared cache so they can use them on every cluster, the entries carry
+# what we know of their profiles too (day, vbucks, research rate)
+async def publish_session(client, user_id):
+    linked = client.linked_auth.get(user_id)
+    if not linked:
+        await cache_delete(client, f"session:{user_id}")
+        return
+
+    entries = list(linked.values())
+    await cache_set(client, f"session:{user_id}", entries, max(entry["expiry"] for entry in entries) - time.time())
+
+
+# a session this process doesn't know about yet, started on another cluster or from before an invalidation
+async def adopt_session(client, user_id):
+    entries = await cache_get(client, f"session:{user_id}")
+    if not entries:
+        return None
+
+    client.linked_auth[user_id] = {entry["account_id"]: entry for entry in entries}
+    client.temp_auth[user_id] = entries[-1]
+    for expiry in {entry["expiry"] for entry in entries}:
+        schedule_session_expiry(client, user_id, expiry)
+    return entries[-1]
+
+
+# the clusters all run in the same directory, so every file one of them writes gets the cluster in its name, otherwise
+# they'd keep overwriting each other's (and fight over the same .tmp file while doing it)
+def cluster_path(client, path):
+    if client.cluster is None:
+        return path
+    root, extension = os.path.splitext(path)
+    return f"{root}.cluster{client.cluster.cluster_id}{extension}"
+
+
+# every guild the bot is in, over all the clusters when there is more than one
+def guild_count(client):
+    if client.cluster is not None and client.cluster.guild_total is not None:
+        return client.cluster.guild_total
+    return local_guild_count(client)
+
+
+# client.guilds copies every guild into a new list just for it to be counted
+def local_guild_count(client):
+    return len(client._connection._guilds)
+
+
 async def retrieve_shard(client, shard_id):
     if shard_id > len(client.config["shard_names"]):
         return shard_id
@@ -79,22 +484,32 @@ async def retrieve_shard(client, shard_id):
 
 
 # returns the time until the end of the day
-def time_until_end_of_day():
-    tomorrow = datetime.datetime.utcnow() + datetime.timedelta(days=1)
-    a = datetime.datetime.combine(tomorrow, datetime.time.min) - datetime.datetime.utcnow()
-    hours, remainder = divmod(int(a.total_seconds()), 3600)
-    minutes, seconds = divmod(remainder, 60)
-    days, hours = divmod(hours, 24)
-    fmt = ''
-    if hours == 1:
-        fmt += '{h} hour, '
-    else:
-        fmt += '{h} hours, '
-    if minutes == 1:
-        fmt += '{m} minute'
-    else:
-        fmt += '{m} minutes'
-    return fmt.format(h=hours, m=minutes)
+# the daily reset is midnight utc, the countdown only shows minutes so it's only worked out again once a minute has
+# actually gone by, everything showing when the reset is (presence, daily, reminders) reads it from here
+class ResetClock:
+
+    def __init__(self):
+        self.next_reset = 0
+        self.countdown_minutes = None
+        self.countdown_text = ""
+
+    def reset_timestamp(self):
+        now = time.time()
+        if now >= self.next_reset:
+            self.next_reset = (int(now) // 86400 + 1) * 86400
+        return self.next_reset
+
+    def countdown(self):
+        minutes_left = int(self.reset_timestamp() - time.time()) // 60
+        if minutes_left != self.countdown_minutes:
+            self.countdown_minutes = minutes_left
+            hours, minutes = divmod(minutes_left, 60)
+            self.countdown_text = (f"{hours} {'hour' if hours == 1 else 'hours'}, "
+                                   f"{minutes} {'minute' if minutes == 1 else 'minutes'}")
+        return self.countdown_text
+
+
+reset_clock = ResetClock()
 
 
 async def mention_string(client, prompt):
@@ -137,25 +552,7 @@ async def set_thumbnail(client, embed, thumb_type):
 
 
 def get_reward(client, day, vbucks=True):
-    day_mod = int(day) % 336
-    if day_mod == 0:
-        day_mod = 336
-
-    item = items.ItemDictionary[str(day_mod)]
-    emojis = item[1:]
-
-    if not vbucks:
-        try:
-            item = [item[0].replace('V-Bucks & ', '')]
-            emojis.remove('vbucks')
-        except:
-            pass
-
-    emoji_text = ""
-    for emoji in emojis:
-        emoji_text += client.config["emojis"][emoji]
-
-    return [item[0], emoji_text]
+    return client.rewards.get(day, vbucks)
 
 
 async def get_token(client, auth_code: str):
@@ -275,28 +672,137 @@ async def check_for_auth_errors(client, request, ctx, message, command, auth_cod
     return False, None, None
 
 
+# discord lets a channel have about 5 message edits every 5 seconds, this keeps us under that instead of finding out
+# from a 429 halfway through the reset rush
+class EditBucket:
+
+    def __init__(self, rate, per):
+        self.rate = rate
+        self.per = per
+        self.tokens = rate
+        self.updated = time.monotonic()
+
+    def refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.rate, self.tokens + (now - self.updated) * self.rate / self.per)
+        self.updated = now
+
+    # how long to wait before the next edit can go out, takes the token when it's 0
+    def delay(self):
+        self.refill()
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return 0
+        return (1 - self.tokens) * self.per / self.rate
+
+    def full(self):
+        self.refill()
+        return self.tokens >= self.rate
+
+
+# every edit of a message goes through here, while one is waiting its turn any newer edit of the same message just
+# gets merged on top of it so only the latest state is sent and everyone waiting gets the message that came back
+class EditQueue:
+
+    def __init__(self, rate=5, per=5.0):
+        self.rate = rate
+        self.per = per
+        self.pending = {}
+        self.locks = {}
+        self.waiting = {}
+        self.buckets = {}
+
+    def bucket(self, bucket_key):
+        bucket = self.buckets.get(bucket_key)
+        if bucket is None:
+            # full buckets are the same as no bucket, so drop them rather than keep one for every channel ever
+            if len(self.buckets) > 1000:
+                for key in [key for key, old in self.buckets.items() if old.full()]:
+                    del self.buckets[key]
+            bucket = self.buckets[bucket_key] = EditBucket(self.rate, self.per)
+        return bucket
+
+    async def edit(self, key, bucket_key, edit, **kwargs):
+        future = asyncio.get_event_loop().create_future()
+
+        pending = self.pending.get(key)
+        if pending is None:
+            self.pending[key] = [edit, kwargs, [future]]
+            asyncio.get_event_loop().create_task(self.flush(key, bucket_key))
+        else:
+            # discord leaves out fields alone, so newer fields on top of the older ones ends up the same message
+            pending[0] = edit
+            pending[1].update(kwargs)
+            pending[2].append(future)
+
+        return await future
+
+    async def flush(self, key, bucket_key):
+        lock = self.locks.setdefault(key, asyncio.Lock())
+        self.waiting[key] = self.waiting.get(key, 0) + 1
+        try:
+            # the edit already on its way finishes first so they can't land out of order
+            async with lock:
+                bucket = self.bucket(bucket_key)
+                delay = bucket.delay()
+                while delay > 0:
+                    await asyncio.sleep(delay)
+                    delay = bucket.delay()
+
+                edit, kwargs, futures = self.pending.pop(key)
+                try:
+                    result = await edit(**kwargs)
+                except Exception as error:
+                    for future in futures:
+                        if not future.done():
+                            future.set_exception(error)
+                    return
+
+                for future in futures:
+                    if not future.done():
+                        future.set_result(result)
+        finally:
+            self.waiting[key] -= 1
+            if self.waiting[key] == 0:
+                del self.waiting[key]
+                del self.locks[key]
+
+
+edit_queue = EditQueue()
+
+
+async def edit_message(message, **kwargs):
+    return await edit_queue.edit(("message", message.id), ("channel", message.channel.id), message.edit, **kwargs)
+
+
+# the original response of an interaction is edited through its webhook, which is rate limited on its own
+async def edit_original(interaction, **kwargs):
+    return await edit_queue.edit(("interaction", interaction.id), ("interaction", interaction.id),
+                                 interaction.edit_original_response, **kwargs)
+
+
 async def slash_edit_original(msg, slash, embeds, view=None):
     try:
         embeds[0]
     except:
         embeds = [embeds]
 
+    changes = {"embeds": embeds}
+    if view is not None:
+        changes["view"] = view
+
     if not slash:
-        if view is not None:
-            return await msg.edit(embeds=embeds, view=view)
-        else:
-            return await msg.edit(embeds=embeds)
+        return await edit_message(msg, **changes)
     else:
-        if view is not None:
-            return await msg.edit_original_response(embeds=embeds, view=view)
-        else:
-            return await msg.edit_original_response(embeds=embeds)
+        return await edit_original(msg, **changes)
 
 
-async def profile_request(client, req_type, auth_entry, data="{}", json=None, profile_id="stw"):
+async def profile_request(client, req_type, auth_entry, data="{}", json=None, profile_id="stw", rvn=None):
     token = auth_entry["token"]
-    url = client.config["endpoints"]["profile"].format(auth_entry["account_id"], client.config["profile"][req_type],
-                                                       client.config["profileid"][profile_id])
+    url = client.config.profile_urls[(req_type, profile_id)].format(auth_entry["account_id"])
+    # with the profile revision we already have epic only sends back the changes since then
+    if rvn is not None:
+        url += f"&rvn={rvn}"
     header = {
         "Content-Type": "application/json",
         "Authorization": f"bearer {token}"
@@ -314,6 +820,17 @@ def vbucks_query_check(profile_text):
     return False
 
 
+# one timer per session expiry, a session adopted again after every invalidation keeps the timer it already has
+def schedule_session_expiry(client, user_id, expiry):
+    key = (user_id, expiry)
+    if key in client.session_timers:
+        return
+
+    task = asyncio.get_event_loop().create_task(auto_stab_stab_session(client, user_id, expiry))
+    client.session_timers[key] = task
+    task.add_done_callback(lambda _task: client.session_timers.pop(key, None))
+
+
 async def auto_stab_stab_session(client, author_id, expiry_time):
     patience_is_a_virtue = expiry_time - time.time()
     await asyncio.sleep(patience_is_a_virtue)
@@ -321,23 +838,100 @@ async def auto_stab_stab_session(client, author_id, expiry_time):
     return
 
 
+async def kill_token(client, token):
+    header = {
+        "Content-Type": "application/json",
+        "Authorization": f"bearer {token}"
+    }
+    endpoint = client.config["endpoints"]["kill_token"].format(token)
+    await client.stw_session.delete(endpoint, headers=header, data="{}")
+
+
+# kills every linked account of a user whose session expires at kill_stamp, or all of them on override
 async def manslaughter_session(client, account_id, kill_stamp):
     try:
-        info = client.temp_auth[account_id]
-        if kill_stamp == "override" or info['expiry'] == kill_stamp:
+        linked = client.linked_auth.get(account_id, {})
+        dead = [info for info in linked.values() if kill_stamp == "override" or info['expiry'] == kill_stamp]
+        for info in dead:
+            linked.pop(info['account_id'], None)
+
+        # temp_auth falls back to whichever remaining account was linked most recently
+        if linked:
+            client.temp_auth[account_id] = list(linked.values())[-1]
+        else:
+            client.linked_auth.pop(account_id, None)
             client.temp_auth.pop(account_id, None)
 
-            header = {
-                "Content-Type": "application/json",
-                "Authorization": f"bearer {info['token']}"
-            }
-            endpoint = client.config["endpoints"]["kill_token"].format(info['token'])
-            await client.stw_session.delete(endpoint, headers=header, data="{}")
+        # nothing died here when the session was already replaced, so the shared one is left alone
+        if dead:
+            await publish_session(client, account_id)
+
+        for info in dead:
+            await kill_token(client, info['token'])
     except:
         pass
         # 😳 they'll never know 😳
 
 
+# a user can keep a few epic accounts signed in at once, temp_auth always points at the one they used last
+async def link_account(client, user_id, entry):
+    linked = client.linked_auth.setdefault(user_id, {})
+
+    # signing into an already linked account again replaces its old session
+    dead = []
+    if entry['account_id'] in linked:
+        dead.append(linked.pop(entry['account_id']))
+    linked[entry['account_id']] = entry
+
+    while len(linked) > client.config["max_linked_accounts"]:
+        dead.append(linked.pop(next(iter(linked))))
+
+    client.temp_auth[user_id] = entry
+    await publish_session(client, user_id)
+
+    for info in dead:
+        try:
+            await kill_token(client, info['token'])
+        except:
+            pass
+
+
+# every account a command should run for, all the linked ones unless an authcode picked a specific account
+# the commands run for these at once and each one gets its own embed in the same message
+async def session_accounts(client, ctx, auth_info, auth_code):
+    if await extract_auth_code(auth_code) != "":
+        return [auth_info[1]]
+
+    linked = client.linked_auth.get(ctx.author.id, {})
+    if auth_info[1] not in linked.values():
+        return [auth_info[1]]
+
+    return list(linked.values())
+
+
+# gather which only lets limit of the coroutines talk to epic at the same time
+async def bounded_gather(coroutines, limit):
+    semaphore = asyncio.Semaphore(limit)
+
+    async def run(coroutine):
+        async with semaphore:
+            return await coroutine
+
+    return await asyncio.gather(*(run(coroutine) for coroutine in coroutines))
+
+
+# names each embed after its account when a command ran for more than one
+# owners lines up with embeds, by default there is one embed per account
+async def label_account_embeds(accounts, embeds, owners=None):
+    if owners is None:
+        owners = accounts
+
+    if len(accounts) > 1:
+        for entry, embed in zip(owners, embeds):
+            embed.set_author(name=entry['account_name'])
+    return list(embeds)
+
+
 async def add_temp_entry(client, ctx, auth_token, account_id, response, add_entry):
     display_name = response["displayName"]
 
@@ -351,7 +945,7 @@ async def add_temp_entry(client, ctx, auth_token, account_id, response, add_entr
     }
 
     if add_entry:
-        asyncio.get_event_loop().create_task(auto_stab_stab_session(client, ctx.author.id, entry['expiry']))
+        schedule_session_expiry(client, ctx.author.id, entry['expiry'])
     profile = await profile_request(client, "query", entry)
     vbucks = await asyncio.gather(asyncio.to_thread(vbucks_query_check, await profile.text()))
     others = await asyncio.gather(asyncio.to_thread(json_query_check, await profile.json()))
@@ -362,7 +956,7 @@ async def add_temp_entry(client, ctx, auth_token, account_id, response, add_entr
         entry["vbucks"] = True
 
     if add_entry:
-        client.temp_auth[ctx.author.id] = entry
+        await link_account(client, ctx.author.id, entry)
 
     return entry
 
@@ -389,21 +983,284 @@ def extract_item(profile_json, item_string="Currency:Mtx"):
 
 
 # method to get stw news from epic
-async def get_stw_news(client):
+async def get_stw_news(client, headers=None):
     endpoint = client.config["endpoints"]["stw_news"]
-    return await client.stw_session.get(endpoint)
+    return await client.stw_session.get(endpoint, headers=headers)
 
 
 # method to get br news from fortnite-api
-async def get_br_news(client):
+async def get_br_news(client, headers=None):
     endpoint = client.config["endpoints"]["br_news"]
-    return await client.stw_session.get(endpoint)
+    return await client.stw_session.get(endpoint, headers=headers)
+
+
+# one version of both news feeds, never modified after creation so it can be handed around freely
+class NewsSnapshot:
+
+    def __init__(self, version, stw_news, br_news):
+        self.version = version
+        self.stw_news = tuple(stw_news)
+        self.br_news = tuple(br_news)
+        self.pages = {}
 
+    def feed(self, mode):
+        if mode == "br":
+            return self.br_news
+        return self.stw_news
 
-# news page embed
-async def create_news_page(self, ctx, news_json, current, total):
-    generic = self.client.colours["generic_blue"]
-    embed = discord.Embed(title=await add_emoji_title(self.client, "News", "placeholder"),
+    # wraps any page number round to one that exists in that feed
+    def clamp_page(self, mode, page):
+        return ((page - 1) % len(self.feed(mode))) + 1
+
+    # every view looking at this snapshot shares the rendered pages, they get dropped along with the snapshot
+    # the cached embeds are never handed out directly since each user gets their own footer on a copy
+    async def page_embed(self, client, ctx, mode, page):
+        try:
+            embed = self.pages[mode, page]
+        except KeyError:
+            news = self.feed(mode)
+            embed = await create_news_embed(client, news, page, len(news))
+            self.pages[mode, page] = embed
+
+        return await add_requested_footer(ctx, embed.copy())
+
+
+# the news only changes a few times a day, so it is kept in memory and refreshed in the background
+# using conditional requests, commands just read whatever snapshot is current
+class NewsCache:
+
+    def __init__(self, client, path):
+        self.client = client
+        self.path = path
+        self.snapshot = None
+        self.checked_at = 0
+        self.validators = {"stw": {}, "br": {}}
+        self.refresh_task = None
+
+        self.feeds = {
+            "stw": (get_stw_news, lambda news_json: news_json["news"]["messages"]),
+            "br": (get_br_news, lambda news_json: news_json["data"]["motds"]),
+        }
+
+    # warm start from the last run so news works before the first refresh finishes
+    def load(self):
+        try:
+            with open(self.path, "r", encoding="utf-8") as cache_file:
+                cached = json.load(cache_file)
+            self.snapshot = NewsSnapshot(cached["version"], cached["stw"], cached["br"])
+            self.validators = cached["validators"]
+        except (OSError, ValueError, KeyError):
+            pass
+
+    def save(self):
+        cached = {
+            "version": self.snapshot.version,
+            "stw": self.snapshot.stw_news,
+            "br": self.snapshot.br_news,
+            "validators": self.validators,
+        }
+        temp_path = f"{self.path}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as cache_file:
+            json.dump(cached, cache_file)
+        os.replace(temp_path, self.path)
+
+    # the new validators only count once the news they came with is in a snapshot, otherwise a refresh that fails halfway
+    # would leave this feed stuck on 304s for news we never kept
+    async def fetch_feed(self, feed):
+        request, extract = self.feeds[feed]
+
+        headers = {}
+        validators = self.validators[feed]
+        if "etag" in validators:
+            headers["If-None-Match"] = validators["etag"]
+        if "last_modified" in validators:
+            headers["If-Modified-Since"] = validators["last_modified"]
+
+        response = await request(self.client, headers)
+        if response.status == 304:
+            response.release()
+            return None, None
+
+        news_json = await response.json(content_type=None)
+        news = extract(news_json)
+
+        validators = {}
+        if response.headers.get("ETag") is not None:
+            validators["etag"] = response.headers["ETag"]
+        if response.headers.get("Last-Modified") is not None:
+            validators["last_modified"] = response.headers["Last-Modified"]
+
+        return news, validators
+
+    async def refresh(self):
+        # without anything to fall back on the conditional headers would just get us an empty 304
+        if self.snapshot is None:
+            self.validators = {"stw": {}, "br": {}}
+
+        (stw_news, stw_validators), (br_news, br_validators) = await asyncio.gather(self.fetch_feed("stw"),
+                                                                                    self.fetch_feed("br"))
+        self.checked_at = time.time()
+
+        if stw_news is None and br_news is None:
+            return self.snapshot
+
+        if stw_news is None:
+            stw_news = self.snapshot.stw_news
+        if br_news is None:
+            br_news = self.snapshot.br_news
+
+        version = 1 if self.snapshot is None else self.snapshot.version + 1
+        self.snapshot = NewsSnapshot(version, stw_news, br_news)
+        if stw_validators is not None:
+            self.validators["stw"] = stw_validators
+        if br_validators is not None:
+            self.validators["br"] = br_validators
+        await asyncio.to_thread(self.save)
+        return self.snapshot
+
+    async def background_refresh(self):
+        try:
+            await self.refresh()
+        except Exception as e:
+            # keep serving the old news, better stale than nothing
+            print("news refresh failed:", e)
+
+    def refresh_in_background(self):
+        if self.refresh_task is None or self.refresh_task.done():
+            self.refresh_task = asyncio.get_event_loop().create_task(self.background_refresh())
+        return self.refresh_task
+
+    # serves the current snapshot straight away, only waits on epic if there has never been any news at all
+    async def get(self):
+        if self.snapshot is None:
+            return await self.refresh()
+
+        if time.time() - self.checked_at > self.client.config["news_refresh_time"]:
+            self.refresh_in_background()
+
+        return self.snapshot
+
+
+# what persistent views need to pick up where they left off, keyed by the id of the message the view is on
+# only plain json goes in here so it survives restarts, everything else gets looked up again when a button is pressed.
+# each kind of view has one instance registered (from on_ready, registering needs the event loop) that handles every
+# message of that kind there is, any other instance is only ever used to draw the buttons
+class ViewStateStore:
+
+    def __init__(self, path, ttl):
+        self.path = path
+        self.ttl = ttl
+        self.states = {}
+        self.save_handle = None
+
+    def load(self):
+        try:
+            with open(self.path, "r", encoding="utf-8") as store_file:
+                self.states = json.load(store_file)
+        except (OSError, ValueError):
+            self.states = {}
+        self.prune()
+
+    def prune(self):
+        now = time.time()
+        for message_id in [message_id for message_id, state in self.states.items() if state["expires"] < now]:
+            del self.states[message_id]
+
+    def write(self, text):
+        temp_path = f"{self.path}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as store_file:
+            store_file.write(text)
+        os.replace(temp_path, self.path)
+
+    # a burst of button presses turns into a single write a second later
+    def schedule_save(self):
+        if self.save_handle is None:
+            self.save_handle = asyncio.get_event_loop().call_later(1, self.save)
+
+    def save(self):
+        self.save_handle = None
+        self.prune()
+        # serialised here so the dict can't change while the thread is writing it out
+        asyncio.get_event_loop().run_in_executor(None, self.write, json.dumps(self.states))
+
+    def get(self, message_id):
+        state = self.states.get(str(message_id))
+        if state is None or state["expires"] < time.time():
+            self.states.pop(str(message_id), None)
+            return None
+        return state
+
+    def put(self, message_id, kind, **state):
+        state["kind"] = kind
+        state["expires"] = time.time() + self.ttl
+        self.states[str(message_id)] = state
+        self.schedule_save()
+        return state
+
+    def remove(self, message_id):
+        if self.states.pop(str(message_id), None) is not None:
+            self.schedule_save()
+
+    # any change counts as activity, so it pushes back the expiry
+    def update(self, message_id, **changes):
+        state = self.get(message_id)
+        if state is None:
+            return None
+        state.update(changes)
+        state["expires"] = time.time() + self.ttl
+        self.schedule_save()
+        return state
+
+
+# the message a command's reply ended up as, slash responses only give back the interaction
+async def sent_message(sent):
+    if isinstance(sent, discord.Interaction):
+        return await sent.original_response()
+    return sent
+
+
+# what a persistent view does when its state is gone, the buttons get switched off on a fresh copy of the view
+async def expired_view_response(client, interaction, view, command, error_code="errors.stwdaily.view_expired",
+                                acc_name=""):
+    for child in view.children:
+        child.disabled = True
+    view.stop()
+
+    embed = await post_error_possibilities(interaction, client, command, acc_name, error_code,
+                                           client.config["support_url"])
+    await send_ephemeral(interaction, embed=embed)
+    try:
+        await edit_message(interaction.message, view=view)
+    except:
+        pass
+
+
+# only the author can use a persistent view, everyone else gets told once per message. who was told is kept for as
+# long as the message's view state, the persistent views stay around for the whole run so this has to clear itself
+async def check_view_author(client, interaction, state, notified, command):
+    if state["author"] == interaction.user.id:
+        return True
+
+    key = (interaction.message.id, interaction.user.id)
+    if key in notified:
+        return False
+
+    now = time.time()
+    for old_key in [old_key for old_key, expires in notified.items() if expires < now]:
+        del notified[old_key]
+    notified[key] = state["expires"]
+
+    embed = await post_error_possibilities(interaction, client, command, "",
+                                           "errors.stwdaily.not_author_interaction_response",
+                                           client.config["support_url"])
+    await send_ephemeral(interaction, embed=embed)
+    return False
+
+
+# news page embed without anything specific to whoever asked for it
+async def create_news_embed(client, news_json, current, total):
+    generic = client.colours["generic_blue"]
+    embed = discord.Embed(title=await add_emoji_title(client, "News", "placeholder"),
                           description=f"\u200b\n**News page {current} of {total}:**\u200b\n"
                                       f"**{news_json[current - 1]['title']}**"
                                       f"\n{news_json[current - 1]['body']}",
@@ -413,8 +1270,7 @@ async def create_news_page(self, ctx, news_json, current, total):
 
     # set embed image
     embed = await set_embed_image(embed, news_json[current - 1]["image"])
-    embed = await set_thumbnail(self.client, embed, "clown")
-    embed = await add_requested_footer(ctx, embed)
+    embed = await set_thumbnail(client, embed, "clown")
     return embed
 
 
@@ -439,17 +1295,36 @@ async def resolve_vbuck_source(vbuck_source):
         return vbuck_source, "placeholder"
 
 
-# method to calculate total vbucks from a list of items
-async def calculate_vbucks(items):
-    vbucks = 0
-    if items:
-        for item in items:
-            for attr, val in item.items():
-                if "debt" in val["templateId"].lower():
-                    vbucks -= val["quantity"]
-                else:
-                    vbucks += val["quantity"]
-    return vbucks
+# one walk over both profiles for everything the vbucks command shows
+# returns the vbucks total, the quantity held per currency templateId (in profile order) and the x-ray ticket count
+def aggregate_currency(core_json, stw_json):
+    total = 0
+    sources = {}
+    xray = None
+
+    try:
+        for item in core_json["profileChanges"][0]["profile"]["items"].values():
+            template_id = item["templateId"]
+            if "Currency:Mtx" not in template_id:
+                continue
+
+            quantity = item["quantity"]
+            sources[template_id] = sources.get(template_id, 0) + quantity
+            if "debt" in template_id.lower():
+                total -= quantity
+            else:
+                total += quantity
+    except:
+        pass
+
+    try:
+        for item in stw_json["profileChanges"][0]["profile"]["items"].values():
+            if "AccountResource:currency_xrayllama" in item["templateId"]:
+                xray = (xray or 0) + item["quantity"]
+    except:
+        pass
+
+    return total, sources, xray
 
 
 async def get_or_create_auth_session(client, ctx, command, original_auth_code, slash, add_entry=False, processing=True):
@@ -492,7 +1367,7 @@ async def get_or_create_auth_session(client, ctx, command, original_auth_code, s
     try:
         existing_auth = client.temp_auth[ctx.author.id]
     except:
-        existing_auth = None
+        existing_auth = await adopt_session(client, ctx.author.id)
 
     # Return auth code if it exists
     if existing_auth is not None and extracted_auth_code == "":
@@ -521,7 +1396,7 @@ async def get_or_create_auth_session(client, ctx, command, original_auth_code, s
             Or [Join the support server]({support_url})
             Note: You need a new code __every time you authenticate__\n\u200b""", colour=error_colour)
 
-    elif extracted_auth_code in client.config["known_auth_codes"]:
+    elif extracted_auth_code in client.config.known_auth_codes:
         error_embed = discord.Embed(
             title=await add_emoji_title(client, ranerror(client), "error"),
             description=f"""\u200b
@@ -779,6 +1654,47 @@ async def post_error_possibilities(ctx, client, command, acc_name, error_code, s
             colour=error_colour
         )
 
+    elif error_code == "errors.stwdaily.view_expired":
+        embed = discord.Embed(
+            title=await add_emoji_title(client, ranerror(client), "error"),
+            description=f"""\u200bExpired:```This {command} view has expired```
+            **To keep going, please use the command again.**
+            \u200b
+            **If you need any help try:**
+            {await mention_string(client, f"help {command}")}
+            Or [Join the support server]({support_url})\n\u200b""",
+            colour=error_colour
+        )
+
+    elif error_code == "errors.stwdaily.view_session_ended":
+        embed = discord.Embed(
+            title=await add_emoji_title(client, ranerror(client), "error"),
+            description=f"""\u200bSession ended:```The auth session for {acc_name} used by this {command} view has ended```
+            **To keep going, please use the command again with a new auth code.**
+            \u200b
+            **If you need any help try:**
+            {await mention_string(client, f"help {command}")}
+            Or [Join the support server]({support_url})
+            Note: You need a new code __every time you authenticate__\n\u200b""",
+            colour=error_colour
+        )
+
+    elif error_code == "errors.stwdaily.research_purchase_failed":
+        embed = discord.Embed(
+            title=await add_emoji_title(client, ranerror(client), "error"),
+            description=f"""\u200b
+            Attempted to level up research for account:
+            ```{acc_name}```
+            **Epic didn't answer one of the purchases**
+            ⦾ Whatever was bought before this is kept, the rest of the queue was cancelled
+            ⦾ Please use the command again to carry on
+            \u200b
+            **If you need any help try:**
+            {await mention_string(client, f"help {command}")}
+            Or [Join the support server]({support_url})\n\u200b""",
+            colour=error_colour
+        )
+
     elif error_code == "errors.stwdaily.homebase_long":
         # TODO: limit size
         embed = discord.Embed(
@@ -841,20 +1757,172 @@ async def strip_string(string):
     return re.sub("[^0-9a-zA-Z]+", "", string)
 
 
-def create_command_dict(client):
-    command_name_dict = {}
-    command_dict = {}
+# restricted damerau-levenshtein (optimal string alignment) distance, gives up early once every
+# cell in a row is above the bound since the distance can only grow from there
+def damerau_levenshtein(a, b, bound):
+    if abs(len(a) - len(b)) > bound:
+        return bound + 1
+
+    previous_previous = None
+    previous = list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        current = [i] + [0] * len(b)
+        for j in range(1, len(b) + 1):
+            cost = 0 if a[i - 1] == b[j - 1] else 1
+            current[j] = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + cost)
+            if i > 1 and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]:
+                current[j] = min(current[j], previous_previous[j - 2] + 1)
+
+        if min(current) > bound:
+            return bound + 1
+        previous_previous, previous = previous, current
+
+    return previous[-1]
+
+
+# how far off an invocation is allowed to be, short words only match exactly since every other short english word is
+# an edit or two away from some command name. four letters gets one edit, but see close_enough
+def typo_bound(word):
+    if len(word) < 4:
+        return 0
+    if len(word) == 4:
+        return 1
+    if len(word) < 8:
+        return 1
+    return 2
+
+
+# a four letter typo (inof, atuh, newz) only counts for a four letter command starting with the same letter, anything
+# looser and words like into or bath start running commands
+def close_enough(word, term):
+    if len(word) != 4:
+        return True
+    return len(term) == 4 and word[0] == term[0]
+
+
+# bk-tree over the command names so typos resolve to the closest command without typing out every typo, aliases are only
+# ever matched exactly. terms are only ever added, snapshots filter the matches down to the terms they actually contain
+class CommandResolver:
+
+    def __init__(self):
+        self.root = None
+
+    def insert(self, term):
+        if self.root is None:
+            self.root = (term, {})
+            return
+
+        node = self.root
+        while True:
+            distance = damerau_levenshtein(term, node[0], max(len(term), len(node[0])))
+            if distance == 0:
+                return
+            try:
+                node = node[1][distance]
+            except KeyError:
+                node[1][distance] = (term, {})
+                return
+
+    def search(self, word, bound):
+        matches = []
+        if self.root is None:
+            return matches
+
+        # walk the tree, the triangle inequality lets us skip any child outside distance +- bound
+        stack = [self.root]
+        while stack:
+            term, children = stack.pop()
+            # anything further than bound + the furthest child can't match or lead to a match so stop counting there
+            distance = damerau_levenshtein(word, term, bound + max(children, default=0))
+            if distance <= bound:
+                matches.append((distance, term))
+
+            for child_distance, child in children.items():
+                if distance - bound <= child_distance <= distance + bound:
+                    stack.append(child)
+
+        return matches
+
+
+# a read only view of the commands at one version, hold onto one for the whole lookup so it stays consistent
+class CommandSnapshot:
+
+    def __init__(self, version, command_name_dict, command_dict, resolver):
+        self.version = version
+        self.command_name_dict = types.MappingProxyType(command_name_dict)
+        self.command_dict = types.MappingProxyType(command_dict)
+        self.command_name_list = tuple(command_name_dict)
+        self.resolver = resolver
+        # commands like kill that end something only ever run when they're typed out properly
+        self.fuzzy_names = frozenset(name for name, command in command_dict.items()
+                                     if not command.extras.get("exact_only"))
+
+    def resolve(self, word):
+        word = word.lower()
+        try:
+            return self.command_name_dict[word]
+        except KeyError:
+            pass
+
+        bound = typo_bound(word)
+        if bound == 0:
+            return None
+
+        matches = [match for match in self.resolver.search(word, bound)
+                   if match[1] in self.fuzzy_names and close_enough(word, match[1])]
+        if not matches:
+            return None
+
+        # prefer the closest match, then alphabetical so it is stable
+        distance, term = min(matches)
+        return term
+
+
+# keeps the command lookups up to date as cogs are added and removed (reloads etc.) by only touching that cogs entries
+class CommandIndex:
+
+    def __init__(self):
+        self.resolver = CommandResolver()
+        self.cog_commands = {}
+        self.snapshot = CommandSnapshot(0, {}, {}, self.resolver)
+
+    def add_cog(self, cog):
+        command_name_dict = dict(self.snapshot.command_name_dict)
+        command_dict = dict(self.snapshot.command_dict)
+        commands = [command for command in cog.get_commands() if isinstance(command, ext.Command)]
+
+        # Gets aliases and adds them to command_name_dict so we can match for aliases too in the command arg
+        for command in commands:
+            for term in [command.name] + list(command.aliases):
+                command_name_dict[term] = command.name
+            self.resolver.insert(command.name)
+
+            command_dict[command.name] = command
+
+        self.cog_commands[cog.qualified_name] = commands
+        self.publish(command_name_dict, command_dict)
+
+    def remove_cog(self, cog):
+        commands = self.cog_commands.pop(cog.qualified_name, [])
+        if not commands:
+            return
+
+        command_name_dict = dict(self.snapshot.command_name_dict)
+        command_dict = dict(self.snapshot.command_dict)
+
+        for command in commands:
+            for term in [command.name] + list(command.aliases):
+                if command_name_dict.get(term) == command.name:
+                    del command_name_dict[term]
 
-    # Gets aliases and adds them to commmand_name_dict so we can match for aliases too in the command arg
-    for command in client.commands:
-        command_name_dict[command.name] = command.name
-        for alias in command.aliases:
-            command_name_dict[alias] = command.name
+            if command_dict.get(command.name) is command:
+                del command_dict[command.name]
 
-        # Adds the command to the 
-        command_dict[command.name] = command
+        self.publish(command_name_dict, command_dict)
 
-    return command_name_dict, command_dict, list(command_name_dict)
+    def publish(self, command_name_dict, command_dict):
+        # swapping the whole snapshot in one go means nobody ever sees half an update
+        self.snapshot = CommandSnapshot(self.snapshot.version + 1, command_name_dict, command_dict, self.resolver)
 
 
 # regex for 32 character hex